@@ -1,9 +1,12 @@
 #!/usr/bin/env python
 """Standalone script to index scriptures for semantic search."""
 
+import os
 import sys
 from pathlib import Path
 
+import torch
+
 # Add src to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
@@ -12,8 +15,44 @@ from scriptorian.data_loader import ScriptureLoader
 from scriptorian.search import SemanticSearch
 
 
+def configure_torch() -> None:
+    """Tune PyTorch threading and matmul precision for bulk encoding."""
+    torch.set_num_threads(os.cpu_count() or 8)
+    try:
+        torch.set_num_interop_threads(2)
+    except RuntimeError:
+        # Only settable once, before any inter-op parallel work has started
+        pass
+    # Allow TF32 tensor cores on Ampere+ GPUs
+    torch.set_float32_matmul_precision('medium')
+
+
+def reduce_precision(semantic_search: SemanticSearch) -> str:
+    """Cast the encoder to half precision where the hardware benefits.
+
+    Returns the dtype name the model runs in. Embeddings still come back
+    as float32 arrays from SemanticSearch.encode().
+    """
+    if semantic_search.backend != "sentence-transformers":
+        return "float32"
+
+    if torch.cuda.is_available():
+        # SemanticSearch already loads the model in float16 on CUDA
+        return "float16"
+
+    # Private helper (torch>=2.2); absent on older releases and non-x86 CPUs
+    bf16_supported = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+    if bf16_supported is not None and bf16_supported():
+        semantic_search.embedder.to(torch.bfloat16)
+        return "bfloat16"
+
+    return "float32"
+
+
 def main():
     """Index all scriptures into vector database."""
+    configure_torch()
+
     print("=" * 60)
     print("Scriptorian - Scripture Indexing")
     print("=" * 60)
@@ -42,33 +81,47 @@ def main():
     print(f"✓ Loaded {len(loader.volumes)} volumes, {len(loader.books)} books")
     print()
 
-    # Initialize semantic search
-    print("Initializing AI model (this may download ~80MB on first run)...")
+    # Initialize semantic search (FASTEMBED=1 selects the quantized ONNX
+    # backend, ONNX=1 the optimized ONNX Runtime graph, ONNX=int8 an int8
+    # export cached in the vector database directory)
+    if os.environ.get("FASTEMBED") == "1":
+        backend = "fastembed"
+    elif os.environ.get("ONNX") == "1":
+        backend = "onnx"
+    elif os.environ.get("ONNX") == "int8":
+        backend = "onnx-int8"
+    else:
+        backend = "sentence-transformers"
+    print(f"Initializing AI model with {backend} (this may download ~80MB on first run)...")
     semantic_search = SemanticSearch(
         loader,
         model_name="sentence-transformers/all-MiniLM-L6-v2",
-        db_path=str(vector_db_path)
+        db_path=str(vector_db_path),
+        backend=backend
     )
 
     try:
         semantic_search.initialize()
-        print("✓ Model loaded successfully")
+        dtype = reduce_precision(semantic_search)
+        print(f"✓ Model loaded successfully ({dtype})")
         print()
     except Exception as e:
         print(f"ERROR initializing model: {e}")
         sys.exit(1)
 
-    # Check if already indexed
+    # Check if already indexed; a partial index from an interrupted run is
+    # resumed by skipping the verses that are already stored
     count = semantic_search.collection.count()
-    if count > 0:
+    force_reindex = False
+    if count > 0 and count >= len(loader.load_all_verses()):
         print(f"⚠️  Vector database already contains {count} verses")
         response = input("Do you want to reindex? (y/N): ").strip().lower()
         if response not in ['y', 'yes']:
             print("Skipping indexing.")
             sys.exit(0)
         force_reindex = True
-    else:
-        force_reindex = False
+    elif count > 0:
+        print(f"↻ Resuming: {count:,} verses already indexed will be skipped")
 
     # Index scriptures
     print()
@@ -78,62 +131,10 @@ def main():
     print()
 
     try:
-        # Load all verses
-        print("Loading all scripture verses...")
-        verses = loader.load_all_verses()
-        total_verses = len(verses)
-        print(f"✓ Loaded {total_verses:,} verses")
-        print()
-
-        # Index in batches
-        print("Generating embeddings and building vector database...")
-        print("(This requires significant computation, please be patient)")
-        print()
+        # Encodes each chunk of verses while the previous one is written to
+        # the database, skipping verses a partial run already stored
+        semantic_search.index_scriptures(force_reindex=force_reindex, resume=True)
 
-        batch_size = 100
-        for i in range(0, total_verses, batch_size):
-            batch = verses[i:i + batch_size]
-
-            # Progress indicator
-            progress = (i + len(batch)) / total_verses * 100
-            print(f"  Progress: {i + len(batch):,}/{total_verses:,} verses ({progress:.1f}%)", end='\r')
-
-            # Generate embeddings for batch
-            texts = [v.text for v in batch]
-            embeddings = semantic_search.embedder.encode(texts, show_progress_bar=False)
-
-            # Prepare metadata
-            metadatas = [
-                {
-                    "reference": v.reference,
-                    "short_reference": v.short_reference,
-                    "book_name": v.book_name,
-                    "chapter": str(v.chapter),
-                    "verse": str(v.verse),
-                    "volume": v.volume
-                }
-                for v in batch
-            ]
-
-            # Generate IDs
-            ids = [f"{v.book_id}_{v.chapter}_{v.verse}" for v in batch]
-
-            # Add to collection
-            if force_reindex and i == 0:
-                # Delete existing and add new
-                try:
-                    semantic_search.collection.delete(ids=ids)
-                except:
-                    pass
-
-            semantic_search.collection.add(
-                embeddings=embeddings.tolist(),
-                documents=texts,
-                metadatas=metadatas,
-                ids=ids
-            )
-
-        print()  # New line after progress
         print()
         print("✓ Indexing complete!")
         print()
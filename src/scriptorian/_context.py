@@ -0,0 +1,94 @@
+"""Context extraction for exact search results.
+
+Kept free of imports and fully annotated so it can be compiled with mypyc
+(see the mypyc build hook in pyproject.toml); the pure-Python module is used
+when no compiled extension is built.
+"""
+
+
+def extract_context(text: str, pos: int, qlen: int, context_words: int) -> str:
+    """
+    Extract context around the match at text[pos:pos + qlen].
+
+    Walks out from the match to word boundaries instead of splitting the
+    whole verse, and highlights the match in **bold**. As with str.split(),
+    any run of whitespace separates two words, and the context joins its
+    words with single spaces.
+    """
+    end = pos + qlen
+    length = len(text)
+
+    if not text.isprintable():
+        # Line breaks, tabs and the like: test each character for whitespace
+        left, right = _whitespace_bounds(text, pos, end, context_words)
+        context = " ".join(f"{text[left:pos]}**{text[pos:end]}**{text[end:right]}".split())
+    else:
+        # Only plain spaces separate the words, so jump between them.
+        # Start of the word containing the match, then context_words more;
+        # runs of spaces (two after most sentences) count as one gap.
+        left = text.rfind(' ', 0, pos) + 1
+        for _ in range(context_words):
+            gap = left
+            while gap > 0 and text[gap - 1] == ' ':
+                gap -= 1
+            if gap == 0:
+                break
+            left = text.rfind(' ', 0, gap) + 1
+
+        # End of the word containing the match, then context_words more
+        right = text.find(' ', end)
+        if right == -1:
+            right = length
+        for _ in range(context_words):
+            gap = right
+            while gap < length and text[gap] == ' ':
+                gap += 1
+            if gap == length:
+                break
+            right = text.find(' ', gap)
+            if right == -1:
+                right = length
+
+        context = f"{text[left:pos]}**{text[pos:end]}**{text[end:right]}"
+        if "  " in context:
+            context = " ".join(context.split())
+
+    # Add ellipsis if truncated
+    if left > 0:
+        context = "... " + context
+    if right < length:
+        context += " ..."
+
+    return context
+
+
+def _whitespace_bounds(text: str, pos: int, end: int, context_words: int) -> tuple[int, int]:
+    """Context bounds for text where any run of whitespace separates words."""
+    left = pos
+    while left > 0 and not text[left - 1].isspace():
+        left -= 1
+    for _ in range(context_words):
+        gap = left
+        while gap > 0 and text[gap - 1].isspace():
+            gap -= 1
+        if gap == 0:
+            break
+        left = gap
+        while left > 0 and not text[left - 1].isspace():
+            left -= 1
+
+    length = len(text)
+    right = end
+    while right < length and not text[right].isspace():
+        right += 1
+    for _ in range(context_words):
+        gap = right
+        while gap < length and text[gap].isspace():
+            gap += 1
+        if gap == length:
+            break
+        right = gap
+        while right < length and not text[right].isspace():
+            right += 1
+
+    return left, right
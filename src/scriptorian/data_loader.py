@@ -1,12 +1,20 @@
 """Load and index scripture data from JSON files."""
 
-import json
+import mmap
+import os
+import pickle
+from collections.abc import Sequence
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from functools import cached_property
 
+import numpy as np
+import orjson
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Verse:
     """Represents a single verse."""
     book_id: str
@@ -16,19 +24,17 @@ class Verse:
     verse: int
     text: str
     volume: str
+    # Formatted once in __post_init__ rather than on every access
+    reference: str = field(init=False, repr=False, compare=False)
+    short_reference: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def reference(self) -> str:
-        """Return formatted reference."""
-        return f"{self.book_name} {self.chapter}:{self.verse}"
-
-    @property
-    def short_reference(self) -> str:
-        """Return abbreviated reference."""
-        return f"{self.book_abbr} {self.chapter}:{self.verse}"
+    def __post_init__(self):
+        # Frozen, so bypass the generated __setattr__
+        object.__setattr__(self, "reference", f"{self.book_name} {self.chapter}:{self.verse}")
+        object.__setattr__(self, "short_reference", f"{self.book_abbr} {self.chapter}:{self.verse}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Book:
     """Represents a book of scripture."""
     id: int
@@ -39,13 +45,317 @@ class Book:
     parent_book_id: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Volume:
     """Represents a volume of scripture."""
     id: int
     abbr: str
     full_name: str
-    books: List[Book]
+    books: Tuple[Book, ...]
+
+
+# Joins verse texts in VerseColumns.corpus; never appears in scripture text,
+# so a match in the corpus cannot span two verses
+CORPUS_SEPARATOR = b"\x1f"
+
+
+def _map_array(path: Path, array: np.ndarray) -> np.ndarray:
+    """Read-only memory map of array saved at path, writing the file if it differs.
+
+    Returned as a plain ndarray view of the mapped pages, since indexing
+    an np.memmap element by element is several times slower.
+    """
+    if path.exists():
+        mapped = np.load(path, mmap_mode='r')
+        if mapped.dtype == array.dtype and np.array_equal(mapped, array):
+            return np.asarray(mapped)
+
+    # Write to a temporary file and rename, so other processes never map a
+    # partial file
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+    return np.asarray(np.load(path, mmap_mode='r'))
+
+
+def _map_bytes(path: Path, data: bytes) -> mmap.mmap:
+    """Read-only memory map of data saved at path, writing the file if it differs."""
+    if not path.exists() or path.read_bytes() != data:
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    with open(path, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class _MappedTexts(Sequence):
+    """Verse texts decoded on access from a memory-mapped corpus.
+
+    Stands in for the list of texts once VerseColumns.share() has mapped
+    the corpus, so the texts live in the shared page cache rather than in
+    each process's heap.
+    """
+
+    def __init__(self, corpus: mmap.mmap, offsets: np.ndarray):
+        self._corpus = corpus
+        # Each verse ends one separator before the next begins
+        self._starts = offsets
+        self._ends = np.append(offsets[1:] - len(CORPUS_SEPARATOR), len(corpus))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        return self._corpus[self._starts[index]:self._ends[index]].decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        corpus = self._corpus
+        for start, end in zip(self._starts.tolist(), self._ends.tolist()):
+            yield corpus[start:end].decode('utf-8')
+
+
+@dataclass(eq=False)
+class VerseColumns:
+    """Struct-of-arrays storage for the full verse corpus.
+
+    Numeric fields are contiguous int16 NumPy arrays; string fields are lists
+    whose repeated book/volume names share a single str object. Behaves as a
+    read-only sequence of Verse, building each Verse on access.
+    """
+    book_id: np.ndarray
+    chapter: np.ndarray
+    verse: np.ndarray
+    text: Sequence[str]
+    book_name: List[str]
+    book_abbr: List[str]
+    volume: List[str]
+
+    @classmethod
+    def from_verses(cls, verses: Iterable[Verse]) -> "VerseColumns":
+        """Build columns from Verse objects."""
+        book_id, chapter, verse_num = [], [], []
+        text, book_name, book_abbr, volume = [], [], [], []
+        for v in verses:
+            book_id.append(int(v.book_id))
+            chapter.append(v.chapter)
+            verse_num.append(v.verse)
+            text.append(v.text)
+            book_name.append(v.book_name)
+            book_abbr.append(v.book_abbr)
+            volume.append(v.volume)
+
+        return cls(
+            book_id=np.array(book_id, dtype=np.int16),
+            chapter=np.array(chapter, dtype=np.int16),
+            verse=np.array(verse_num, dtype=np.int16),
+            text=text,
+            book_name=book_name,
+            book_abbr=book_abbr,
+            volume=volume
+        )
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Verse, List[Verse]]:
+        if isinstance(index, slice):
+            # Convert each numeric column once rather than per element
+            return [
+                Verse(
+                    book_id=str(book_id),
+                    book_name=book_name,
+                    book_abbr=book_abbr,
+                    chapter=chapter,
+                    verse=verse,
+                    text=text,
+                    volume=volume
+                )
+                for book_id, chapter, verse, text, book_name, book_abbr, volume in zip(
+                    self.book_id[index].tolist(),
+                    self.chapter[index].tolist(),
+                    self.verse[index].tolist(),
+                    self.text[index],
+                    self.book_name[index],
+                    self.book_abbr[index],
+                    self.volume[index]
+                )
+            ]
+
+        i = range(len(self))[index]
+        return Verse(
+            book_id=str(self.book_id[i]),
+            book_name=self.book_name[i],
+            book_abbr=self.book_abbr[i],
+            chapter=int(self.chapter[i]),
+            verse=int(self.verse[i]),
+            text=self.text[i],
+            volume=self.volume[i]
+        )
+
+    def __iter__(self) -> Iterator[Verse]:
+        for i in range(len(self)):
+            yield self[i]
+
+    @cached_property
+    def ids(self) -> List[str]:
+        """Vector database IDs ("bookId_chapter_verse"), built once."""
+        return [
+            f"{b}_{c}_{v}"
+            for b, c, v in zip(
+                self.book_id.tolist(), self.chapter.tolist(), self.verse.tolist()
+            )
+        ]
+
+    @cached_property
+    def _chapter_keys(self) -> Optional[np.ndarray]:
+        """(book, chapter) packed into one sortable int32, or None if unsorted."""
+        keys = self.book_id.astype(np.int32) * 1000 + self.chapter
+        return keys if np.all(keys[1:] >= keys[:-1]) else None
+
+    def chapter_verses(self, book_id: int, chapter: int) -> List[Verse]:
+        """One chapter's verses, in order."""
+        keys = self._chapter_keys
+        if keys is None:
+            # Columns not in (book, chapter) order; fall back to a full mask
+            rows = np.nonzero((self.book_id == book_id) & (self.chapter == chapter))[0]
+            return [self[i] for i in rows.tolist()]
+
+        key = book_id * 1000 + chapter
+        start, end = np.searchsorted(keys, [key, key + 1])
+        return self[int(start):int(end)]
+
+    @cached_property
+    def _corpus_layout(self) -> Tuple[bytes, np.ndarray, np.ndarray]:
+        encoded = [text.encode('utf-8') for text in self.text]
+        lengths = np.fromiter(
+            (len(data) for data in encoded), dtype=np.int64, count=len(encoded)
+        )
+        # Each verse starts after the previous verses and their separators
+        offsets = np.cumsum(lengths + 1) - (lengths + 1)
+        ascii_mask = lengths == np.fromiter(
+            (len(text) for text in self.text), dtype=np.int64, count=len(encoded)
+        )
+        return CORPUS_SEPARATOR.join(encoded), offsets, ascii_mask
+
+    @property
+    def corpus(self) -> bytes:
+        """Every verse text as UTF-8, joined by CORPUS_SEPARATOR, built once.
+
+        Mostly ASCII, so half the size of a str holding the few curly quotes
+        and pilcrows, and bytes patterns scan it faster.
+        """
+        return self._corpus_layout[0]
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Byte offset of each verse within corpus."""
+        return self._corpus_layout[1]
+
+    @property
+    def ascii_mask(self) -> np.ndarray:
+        """True for verses whose byte and character offsets agree."""
+        return self._corpus_layout[2]
+
+    @cached_property
+    def lower_corpus(self) -> Optional[bytes]:
+        """corpus with every verse lowercased, for case-insensitive scans.
+
+        None if lowercasing changes the length of any verse, since the
+        verse offsets would no longer line up.
+        """
+        lowered = [text.lower() for text in self.text]
+        encoded = [text.encode('utf-8') for text in lowered]
+        lengths = np.fromiter(
+            (len(data) + 1 for data in encoded), dtype=np.int64, count=len(encoded)
+        )
+        # Each verse must keep both its byte offset and its character count
+        aligned = np.array_equal(np.cumsum(lengths)[:-1], self.offsets[1:]) and all(
+            len(low) == len(text) for low, text in zip(lowered, self.text)
+        )
+        return CORPUS_SEPARATOR.join(encoded) if aligned else None
+
+    def share(self, directory: Path) -> None:
+        """Back the numeric columns, corpus buffers and texts with files in directory.
+
+        Each is written once and memory-mapped read-only, so processes that
+        share the directory (e.g. several server workers) read the same OS
+        page cache instead of each holding a private copy. The corpus
+        buffers become mmap objects, which support the bytes methods
+        ExactSearch uses, and the texts are decoded from the corpus on access.
+        """
+        if not self.text:
+            return  # mmap cannot map an empty file
+
+        directory.mkdir(parents=True, exist_ok=True)
+        self.book_id = _map_array(directory / "book_id.npy", self.book_id)
+        self.chapter = _map_array(directory / "chapter.npy", self.chapter)
+        self.verse = _map_array(directory / "verse.npy", self.verse)
+
+        corpus, offsets, ascii_mask = self._corpus_layout
+        self._corpus_layout = (
+            _map_bytes(directory / "corpus.bin", corpus),
+            _map_array(directory / "offsets.npy", offsets),
+            _map_array(directory / "ascii_mask.npy", ascii_mask)
+        )
+        lower_corpus = self.lower_corpus
+        if lower_corpus is not None:
+            self.lower_corpus = _map_bytes(directory / "lower_corpus.bin", lower_corpus)
+
+        # The texts are the largest per-process cost; read them back out of
+        # the shared corpus instead
+        self.text = _MappedTexts(*self._corpus_layout[:2])
+
+    @cached_property
+    def metadatas(self) -> List[Dict[str, str]]:
+        """Vector database metadata dicts, built once."""
+        return [
+            {
+                "reference": f"{name} {c}:{v}",
+                "short_reference": f"{abbr} {c}:{v}",
+                "book_name": name,
+                "chapter": str(c),
+                "verse": str(v),
+                "volume": volume
+            }
+            for name, abbr, c, v, volume in zip(
+                self.book_name,
+                self.book_abbr,
+                self.chapter.tolist(),
+                self.verse.tolist(),
+                self.volume
+            )
+        ]
+
+
+# Bump when the pickled verse layout or order changes so stale caches are rebuilt
+CACHE_VERSION = 5
+
+
+def _parse_file(args: Tuple[str, int, int, str, str, str]) -> List[Verse]:
+    """Parse one chapter file into verses."""
+    path, book_id, chapter, book_name, book_abbr, volume_name = args
+
+    try:
+        data = orjson.loads(Path(path).read_bytes())
+
+        return [
+            Verse(
+                book_id=str(book_id),
+                book_name=book_name,
+                book_abbr=book_abbr,
+                chapter=chapter,
+                verse=int(verse_data['Verse']),
+                text=verse_data['Text'],
+                volume=volume_name
+            )
+            for verse_data in data
+        ]
+    except (ValueError, KeyError):  # orjson.JSONDecodeError is a ValueError
+        return []
 
 
 class ScriptureLoader:
@@ -54,15 +364,19 @@ class ScriptureLoader:
     def __init__(self, data_path: Path):
         """Initialize loader with path to data directory."""
         self.data_path = data_path
+        self.cache_path = data_path / "verses.pkl"
         self.volumes: Dict[str, Volume] = {}
         self.books: Dict[str, Book] = {}
-        self.verses: List[Verse] = []
+        # Lowercase lookup indexes, filled by load_volumes()
+        self._abbr_index: Dict[str, Book] = {}
+        self._cite_index: Dict[str, Book] = {}
+        self._name_index: Dict[str, Book] = {}
+        self.verses: Optional[VerseColumns] = None
 
     def load_volumes(self) -> None:
         """Load volume and book metadata."""
         volumes_file = self.data_path / "volumes.json"
-        with open(volumes_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = orjson.loads(volumes_file.read_bytes())
 
         for vol_data in data:
             books = []
@@ -83,81 +397,154 @@ class ScriptureLoader:
                 id=vol_data['id'],
                 abbr=vol_data['abbr'],
                 full_name=vol_data['fullName'],
-                books=books
+                books=tuple(books)
             )
             self.volumes[volume.abbr] = volume
             self.volumes[str(volume.id)] = volume
 
+        # setdefault keeps the first book in load order, matching a linear scan
+        for book in self.books.values():
+            self._abbr_index.setdefault(book.abbr.lower(), book)
+            self._cite_index.setdefault(book.cite_abbr.lower(), book)
+            self._name_index.setdefault(book.full_name.lower(), book)
+
     def load_scripture_verses(self, book_id: int, chapter: int) -> List[Verse]:
         """Load verses for a specific book and chapter."""
+        if self.verses is not None:
+            # Already in memory: slice the columns instead of reading the file
+            return self.verses.chapter_verses(book_id, chapter)
+
         scripture_file = self.data_path / "scripture" / f"{book_id}.{chapter}.json"
 
         if not scripture_file.exists():
             return []
 
-        with open(scripture_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        book = self.books.get(str(book_id))
-        if not book:
+        args = self._parse_args(scripture_file, book_id, chapter)
+        if not args:
             return []
 
-        volume = self.volumes.get(str(book.parent_book_id))
-        volume_name = volume.full_name if volume else "Unknown"
+        return _parse_file(args)
 
-        verses = []
-        for verse_data in data:
-            verse = Verse(
-                book_id=str(book_id),
-                book_name=book.full_name,
-                book_abbr=book.cite_abbr,
-                chapter=chapter,
-                verse=int(verse_data['Verse']),
-                text=verse_data['Text'],
-                volume=volume_name
-            )
-            verses.append(verse)
-
-        return verses
-
-    def load_all_verses(self) -> List[Verse]:
+    def load_all_verses(self) -> VerseColumns:
         """Load all verses from all books."""
-        if self.verses:
+        if self.verses is not None:
             return self.verses
 
         scripture_dir = self.data_path / "scripture"
         if not scripture_dir.exists():
-            return []
+            return VerseColumns.from_verses([])
+
+        # scandir avoids a Path per file; sort numerically by (book, chapter)
+        # so 101.2 precedes 101.10
+        chapters = []
+        total_size = max_mtime = 0
+        with os.scandir(scripture_dir) as entries:
+            for entry in entries:
+                # Parse filename: bookId.chapter.json
+                if not entry.name.endswith('.json'):
+                    continue
+                parts = entry.name[:-5].split('.')
+                if len(parts) != 2:
+                    continue
 
-        all_verses = []
-        for scripture_file in sorted(scripture_dir.glob("*.json")):
-            # Parse filename: bookId.chapter.json
-            parts = scripture_file.stem.split('.')
-            if len(parts) != 2:
-                continue
-
-            try:
-                book_id = int(parts[0])
-                chapter = int(parts[1])
-                verses = self.load_scripture_verses(book_id, chapter)
-                all_verses.extend(verses)
-            except (ValueError, KeyError):
-                continue
+                try:
+                    chapters.append((int(parts[0]), int(parts[1]), entry.path))
+                except ValueError:
+                    continue
+                stat = entry.stat()
+                total_size += stat.st_size
+                max_mtime = max(max_mtime, stat.st_mtime_ns)
+
+        # Adding, removing or editing any chapter file changes the fingerprint
+        try:
+            volumes_stat = (self.data_path / "volumes.json").stat()
+            volumes_key = (volumes_stat.st_size, volumes_stat.st_mtime_ns)
+        except OSError:
+            volumes_key = None
+        fingerprint = (len(chapters), total_size, max_mtime, volumes_key)
+
+        cached = self._read_cache(fingerprint)
+        if cached is not None:
+            self.verses = cached
+            return cached
+
+        chapters.sort()
+
+        file_args = []
+        for book_id, chapter, path in chapters:
+            args = self._parse_args(path, book_id, chapter)
+            if args:
+                file_args.append(args)
+
+        # Parsed in-process: the whole corpus takes a fraction of a second,
+        # less than starting a process pool, and a fork from inside the
+        # threaded server is unsafe
+        all_verses = VerseColumns.from_verses(
+            chain.from_iterable(_parse_file(args) for args in file_args)
+        )
 
         self.verses = all_verses
+        self._write_cache(all_verses, fingerprint)
         return all_verses
 
+    def _read_cache(self, fingerprint: Tuple) -> Optional[VerseColumns]:
+        """Return cached verses if they were parsed from the same source files."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                version, cached_fingerprint, verses = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            return None
+
+        if version != CACHE_VERSION or cached_fingerprint != fingerprint:
+            return None
+        return verses
+
+    def _write_cache(self, verses: VerseColumns, fingerprint: Tuple) -> None:
+        """Persist parsed verses; silently skipped if the data dir is read-only."""
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((CACHE_VERSION, fingerprint, verses), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def _parse_args(
+        self,
+        scripture_file: Union[str, Path],
+        book_id: int,
+        chapter: int
+    ) -> Optional[Tuple[str, int, int, str, str, str]]:
+        """Build the arguments for _parse_file, or None if the book is unknown."""
+        book = self.books.get(str(book_id))
+        if not book:
+            return None
+
+        volume = self.volumes.get(str(book.parent_book_id))
+        volume_name = volume.full_name if volume else "Unknown"
+
+        return (
+            str(scripture_file),
+            book_id,
+            chapter,
+            book.full_name,
+            book.cite_abbr,
+            volume_name
+        )
+
     def get_book_by_abbr(self, abbr: str) -> Optional[Book]:
         """Get book by abbreviation (case-insensitive)."""
         abbr_lower = abbr.lower()
-        for key, book in self.books.items():
-            if book.abbr.lower() == abbr_lower or book.cite_abbr.lower() == abbr_lower:
-                return book
-        return None
+        return self._abbr_index.get(abbr_lower) or self._cite_index.get(abbr_lower)
 
     def get_book_by_name(self, name: str) -> Optional[Book]:
         """Get book by full or partial name (case-insensitive)."""
         name_lower = name.lower()
+        book = self._name_index.get(name_lower)
+        if book:
+            return book
+
+        # Partial names need a substring scan
         for book in self.books.values():
             if isinstance(book, Book):
                 if name_lower in book.full_name.lower():
@@ -1,36 +1,37 @@
 """Parse plain text scripture references into structured format."""
 
 import re
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VerseSegment:
     """Represents a range of verses."""
     start: int
     end: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChapterSegment:
     """Represents a chapter with optional verse ranges."""
     start: int
     end: int
-    verses: List[VerseSegment]
+    verses: Tuple[VerseSegment, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BookReference:
     """Represents a book with chapter and verse ranges."""
     book: str
-    chapters: List[ChapterSegment]
+    chapters: Tuple[ChapterSegment, ...]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedReference:
     """Result of parsing a reference string."""
-    references: List[BookReference]
+    references: Tuple[BookReference, ...]
     pretty_string: str
     valid: bool
     error: Optional[str] = None
@@ -39,6 +40,13 @@ class ParsedReference:
 class ReferenceParser:
     """Parse plain text scripture references."""
 
+    # Book name followed by the chapter/verse part, e.g. "1 Ne" + "3:7"
+    _BOOK_RE = re.compile(r'^([a-zA-Z0-9\s&]+?)\s*(\d+.*)')
+    # Separators between chapter segments
+    _SEG_RE = re.compile(r'[,;]')
+    # A single number or a "start-end" range, with optional whitespace
+    _RANGE_RE = re.compile(r'\s*(\d+)\s*(?:-\s*(\d+))?\s*')
+
     # Common book abbreviations (case-insensitive)
     BOOK_ABBR = {
         # Old Testament
@@ -90,12 +98,17 @@ class ReferenceParser:
         """
         if not reference or not reference.strip():
             return ParsedReference(
-                references=[],
+                references=(),
                 pretty_string="",
                 valid=False,
                 error="Empty reference string"
             )
 
+        return _parse_cached(reference.strip())
+
+    @classmethod
+    def _parse_impl(cls, reference: str) -> ParsedReference:
+        """Parse a non-empty reference string (uncached)."""
         try:
             # Split by semicolon for multiple book references
             book_refs = reference.split(';')
@@ -112,7 +125,7 @@ class ReferenceParser:
 
             if not parsed_books:
                 return ParsedReference(
-                    references=[],
+                    references=(),
                     pretty_string="",
                     valid=False,
                     error="No valid references found"
@@ -121,14 +134,14 @@ class ReferenceParser:
             pretty = cls._format_pretty_string(parsed_books)
 
             return ParsedReference(
-                references=parsed_books,
+                references=tuple(parsed_books),
                 pretty_string=pretty,
                 valid=True
             )
 
         except Exception as e:
             return ParsedReference(
-                references=[],
+                references=(),
                 pretty_string="",
                 valid=False,
                 error=f"Parse error: {str(e)}"
@@ -138,7 +151,7 @@ class ReferenceParser:
     def _parse_book_reference(cls, ref: str) -> Optional[BookReference]:
         """Parse a single book reference."""
         # Match book name at start
-        match = re.match(r'^([a-zA-Z0-9\s&]+?)\s*(\d+.*)', ref)
+        match = cls._BOOK_RE.match(ref)
         if not match:
             return None
 
@@ -153,7 +166,7 @@ class ReferenceParser:
         # Parse chapter:verse ranges
         chapters = cls._parse_chapter_ranges(rest)
 
-        return BookReference(book=book_abbr, chapters=chapters)
+        return BookReference(book=book_abbr, chapters=tuple(chapters))
 
     @classmethod
     def _normalize_book_name(cls, name: str) -> Optional[str]:
@@ -168,7 +181,7 @@ class ReferenceParser:
         chapters = []
 
         # Split by comma for multiple chapter segments
-        segments = re.split(r'[,;]', text)
+        segments = cls._SEG_RE.split(text)
 
         for segment in segments:
             segment = segment.strip()
@@ -197,7 +210,7 @@ class ReferenceParser:
                 chapters.append(ChapterSegment(
                     start=chapter_range[0],
                     end=chapter_range[1],
-                    verses=verse_ranges
+                    verses=tuple(verse_ranges)
                 ))
             else:
                 # No verses, just chapter range
@@ -206,29 +219,21 @@ class ReferenceParser:
                     chapters.append(ChapterSegment(
                         start=chapter_range[0],
                         end=chapter_range[1],
-                        verses=[]
+                        verses=()
                     ))
 
         return chapters
 
-    @staticmethod
-    def _parse_range(text: str) -> Optional[tuple[int, int]]:
+    @classmethod
+    def _parse_range(cls, text: str) -> Optional[tuple[int, int]]:
         """Parse a numeric range like '1-5' or single number '3'."""
-        text = text.strip()
-        if '-' in text:
-            parts = text.split('-', 1)
-            try:
-                start = int(parts[0].strip())
-                end = int(parts[1].strip())
-                return (start, end)
-            except ValueError:
-                return None
-        else:
-            try:
-                num = int(text)
-                return (num, num)
-            except ValueError:
-                return None
+        match = cls._RANGE_RE.fullmatch(text)
+        if not match:
+            return None
+
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else start
+        return (start, end)
 
     @classmethod
     def _format_pretty_string(cls, refs: List[BookReference]) -> str:
@@ -294,3 +299,9 @@ class ReferenceParser:
             result["references"].append(book_dict)
 
         return result
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(reference: str) -> ParsedReference:
+    """Memoize parsing; it is pure, so repeated references share one result."""
+    return ReferenceParser._parse_impl(reference)
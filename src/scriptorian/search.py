@@ -1,13 +1,33 @@
 """Search functionality for scriptures."""
 
+import bisect
+import os
+import platform
 import re
-from typing import List, Dict, Any, Optional
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
+from functools import lru_cache
+from pathlib import Path
 
-from .data_loader import ScriptureLoader, Verse
+import numpy as np
+import orjson
 
+try:
+    import ahocorasick_rs
+except ImportError:  # optional: single-pass multi_search
+    ahocorasick_rs = None
 
-@dataclass
+from ._context import extract_context
+from .data_loader import CORPUS_SEPARATOR, ScriptureLoader, VerseColumns
+
+
+_WORD_RE = re.compile(r'\w+')
+
+
+@dataclass(slots=True, frozen=True)
 class SearchResult:
     """Represents a search result."""
     reference: str
@@ -24,9 +44,39 @@ class SearchResult:
 class ExactSearch:
     """Exact string search across scriptures."""
 
+    SEPARATOR = CORPUS_SEPARATOR
+
+    # Fall back to a full scan when the word index leaves more than
+    # 1/MAX_CANDIDATE_FRACTION of the verses as candidates
+    MAX_CANDIDATE_FRACTION = 8
+    # Stop intersecting posting lists once this few candidates remain
+    MIN_INTERSECT = 256
+    # Shorter query words occur inside most verses' words, so they cannot
+    # narrow the search and only cost a walk of the vocabulary
+    MIN_TOKEN_LENGTH = 2
+
     def __init__(self, loader: ScriptureLoader):
         """Initialize with scripture loader."""
         self.loader = loader
+        self._verses = None
+        self._corpus = b""
+        self._offsets = np.zeros(0, dtype=np.int64)
+        # Same offsets as ints, for bisect in the per-match scan loops
+        self._offset_list: List[int] = []
+        self._ascii = np.zeros(0, dtype=bool)
+        self._postings: Optional[Dict[str, np.ndarray]] = None
+
+    def _load_corpus(self):
+        """Return the verse columns, picking up their corpus buffer if they changed."""
+        verses = self.loader.load_all_verses()
+        if verses is not self._verses:
+            self._corpus = verses.corpus
+            self._offsets = verses.offsets
+            self._offset_list = verses.offsets.tolist()
+            self._ascii = verses.ascii_mask
+            self._postings = None
+            self._verses = verses
+        return verses
 
     def search(
         self,
@@ -48,99 +98,287 @@ class ExactSearch:
         if not query or not query.strip():
             return []
 
-        results = []
-        verses = self.loader.load_all_verses()
+        verses = self._load_corpus()
+        lower_query = query.lower()
 
-        search_pattern = query if case_sensitive else query.lower()
+        if case_sensitive:
+            needle = query
+            corpus = self._corpus
+        else:
+            # Plain literal scan of the lowercase corpus, built once by the
+            # loader, which is cheaper than case folding on every query
+            needle = lower_query
+            corpus = verses.lower_corpus
+
+        candidates = self._candidates(lower_query)
+        if corpus is None:
+            matches = self._scan_texts(needle, candidates)
+        elif candidates is None:
+            matches = self._scan(needle.encode('utf-8'), corpus)
+        else:
+            matches = self._scan_candidates(needle.encode('utf-8'), corpus, candidates)
 
-        for verse in verses:
-            verse_text = verse.text if case_sensitive else verse.text.lower()
+        return self._build_results(verses, matches, context_words)
 
-            if search_pattern in verse_text:
-                # Extract context around the match
-                context = self._extract_context(
-                    verse.text,
-                    query,
-                    context_words,
-                    case_sensitive
-                )
+    def multi_search(
+        self,
+        terms: List[str],
+        case_sensitive: bool = False,
+        context_words: int = 5
+    ) -> Dict[str, List[SearchResult]]:
+        """
+        Search for several exact strings at once.
 
-                result = SearchResult(
-                    reference=verse.reference,
-                    short_reference=verse.short_reference,
-                    verse_text=verse.text,
-                    context=context,
-                    book_name=verse.book_name,
-                    chapter=verse.chapter,
-                    verse=verse.verse,
-                    volume=verse.volume
-                )
-                results.append(result)
+        With ahocorasick_rs installed every term is found in a single pass
+        over the corpus; otherwise each term is searched separately.
 
-        return results
+        Args:
+            terms: Search strings
+            case_sensitive: Whether search is case-sensitive
+            context_words: Number of words to include before/after match
+
+        Returns:
+            Dict mapping each non-empty term to its list of SearchResult objects
+        """
+        terms = list(dict.fromkeys(term for term in terms if term and term.strip()))
+        if not terms:
+            return {}
+
+        verses = self._load_corpus()
+        needles = terms if case_sensitive else [term.lower() for term in terms]
+        corpus = self._corpus if case_sensitive else verses.lower_corpus
+
+        if ahocorasick_rs is None or corpus is None:
+            return {
+                term: self.search(term, case_sensitive, context_words) for term in terms
+            }
+
+        automaton = ahocorasick_rs.BytesAhoCorasick(
+            [needle.encode('utf-8') for needle in needles]
+        )
+        offsets = self._offsets
+
+        # Overlapping matches so "faith" is still found inside "faithful"
+        # when both are terms
+        found = np.array(
+            automaton.find_matches_as_indexes(corpus, overlapping=True), dtype=np.int64
+        ).reshape(-1, 3)
+        verse_indices = np.searchsorted(offsets, found[:, 1], side='right') - 1
+
+        # Keep the first match of each term per verse, in corpus order
+        order = np.lexsort((found[:, 1], verse_indices, found[:, 0]))
+        found, verse_indices = found[order], verse_indices[order]
+        first = np.ones(len(found), dtype=bool)
+        first[1:] = (found[1:, 0] != found[:-1, 0]) | (verse_indices[1:] != verse_indices[:-1])
+
+        matches: List[List[Tuple[int, int, int]]] = [[] for _ in terms]
+        for term_index, start, end, i in zip(
+            found[first, 0].tolist(),
+            found[first, 1].tolist(),
+            found[first, 2].tolist(),
+            verse_indices[first].tolist()
+        ):
+            matches[term_index].append((i, *self._locate(corpus, i, start, end)))
+
+        return {
+            term: self._build_results(verses, term_matches, context_words)
+            for term, term_matches in zip(terms, matches)
+        }
 
-    def _extract_context(
+    def _build_results(
         self,
-        text: str,
-        query: str,
-        context_words: int,
-        case_sensitive: bool
-    ) -> str:
-        """Extract context around the match with highlighting."""
-        # Find the position of the match
-        search_text = text if case_sensitive else text.lower()
-        search_query = query if case_sensitive else query.lower()
-
-        pos = search_text.find(search_query)
-        if pos == -1:
-            return text[:100] + "..." if len(text) > 100 else text
-
-        # Split into words
-        words = text.split()
-
-        # Find which word contains the match
-        char_count = 0
-        match_word_idx = 0
-
-        for idx, word in enumerate(words):
-            if char_count <= pos < char_count + len(word):
-                match_word_idx = idx
+        verses: VerseColumns,
+        matches: Iterable[Tuple[int, int, int]],
+        context_words: int
+    ) -> List[SearchResult]:
+        """Build results from (verse index, match offset, match length) tuples.
+
+        Reads the verse columns directly rather than building a Verse per match.
+        """
+        texts = verses.text
+        book_names = verses.book_name
+        book_abbrs = verses.book_abbr
+        volumes = verses.volume
+        chapters = verses.chapter
+        verse_nums = verses.verse
+
+        results = []
+        for i, pos, qlen in matches:
+            text = texts[i]
+            book_name = book_names[i]
+            chapter = int(chapters[i])
+            verse = int(verse_nums[i])
+
+            result = SearchResult(
+                reference=f"{book_name} {chapter}:{verse}",
+                short_reference=f"{book_abbrs[i]} {chapter}:{verse}",
+                verse_text=text,
+                # Extract context around the match
+                context=extract_context(text, pos, qlen, context_words),
+                book_name=book_name,
+                chapter=chapter,
+                verse=verse,
+                volume=volumes[i]
+            )
+            results.append(result)
+
+        return results
+
+    def _scan(self, needle: bytes, corpus: bytes) -> Iterator[Tuple[int, int, int]]:
+        """Yield (verse index, match offset, match length) from one scan of the corpus."""
+        offsets = self._offset_list
+
+        # bytes.find is CPython's fastest literal search; after a hit,
+        # resume at the next verse so each verse is reported once
+        start = corpus.find(needle)
+        while start != -1:
+            i = bisect.bisect_right(offsets, start) - 1
+            yield (i, *self._locate(corpus, i, start, start + len(needle)))
+
+            if i + 1 >= len(offsets):
                 break
-            char_count += len(word) + 1  # +1 for space
+            start = corpus.find(needle, offsets[i + 1])
 
-        # Extract context
-        start_idx = max(0, match_word_idx - context_words)
-        end_idx = min(len(words), match_word_idx + context_words + 1)
+    def _scan_candidates(
+        self,
+        needle: bytes,
+        corpus: bytes,
+        candidates: np.ndarray
+    ) -> Iterator[Tuple[int, int, int]]:
+        """Yield (verse index, match offset, match length) for candidate verses that match."""
+        offsets = self._offset_list
+        ends = offsets[1:] + [len(corpus) + 1]
+
+        for i in candidates.tolist():
+            start = corpus.find(needle, offsets[i], ends[i] - 1)
+            if start != -1:
+                yield (i, *self._locate(corpus, i, start, start + len(needle)))
+
+    def _scan_texts(
+        self,
+        needle: str,
+        candidates: Optional[np.ndarray]
+    ) -> Iterator[Tuple[int, int, int]]:
+        """Case-insensitive scan verse by verse, for when no lowercase corpus lines up."""
+        texts = self._verses.text
+        indices = range(len(texts)) if candidates is None else candidates.tolist()
+
+        for i in indices:
+            pos = texts[i].lower().find(needle)
+            if pos != -1:
+                yield i, pos, len(needle)
+
+    def _locate(self, corpus: bytes, i: int, start: int, end: int) -> Tuple[int, int]:
+        """Convert the byte match corpus[start:end] in verse i to a character offset and length."""
+        verse_start = self._offset_list[i]
+        if self._ascii[i]:
+            return start - verse_start, end - start
+        return (
+            len(corpus[verse_start:start].decode('utf-8')),
+            len(corpus[start:end].decode('utf-8'))
+        )
 
-        context_words_list = words[start_idx:end_idx]
+    def _candidates(self, lower_query: str) -> Optional[np.ndarray]:
+        """
+        Narrow a lowercased query to candidate verses using the word index.
 
-        # Add ellipsis if truncated
-        if start_idx > 0:
-            context_words_list.insert(0, "...")
-        if end_idx < len(words):
-            context_words_list.append("...")
+        Each query word must appear inside some word of a matching verse, so
+        the candidates are the verses containing such a word, intersected
+        across the query words. Returns None when a full scan is needed.
+        """
+        tokens = {
+            token for token in _WORD_RE.findall(lower_query)
+            if len(token) >= self.MIN_TOKEN_LENGTH
+        }
+        if not tokens:
+            # Scan directly, without building the postings for nothing
+            return None
+
+        postings = self._get_postings()
+        candidates = None
+        # Longer words are more selective; once few candidates remain the
+        # substring check settles the rest more cheaply than more lookups
+        for token in sorted(tokens, key=len, reverse=True):
+            if candidates is not None and len(candidates) <= self.MIN_INTERSECT:
+                break
 
-        context = ' '.join(context_words_list)
+            # Substring semantics: "faith" must also find "faithful"
+            lists = [
+                indices for word, indices in postings.items() if token in word
+            ]
+            if not lists:
+                return np.zeros(0, dtype=np.int64)
 
-        # Highlight the match (wrap in **bold** markers)
-        if not case_sensitive:
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(query), re.IGNORECASE)
-            context = pattern.sub(f"**{query}**", context, count=1)
-        else:
-            context = context.replace(query, f"**{query}**", 1)
+            found = np.unique(np.concatenate(lists)) if len(lists) > 1 else lists[0]
+            candidates = found if candidates is None else np.intersect1d(
+                candidates, found, assume_unique=True
+            )
 
-        return context
+        # A broad query is cheaper to answer with one scan of the corpus
+        if len(candidates) > len(self._offsets) // self.MAX_CANDIDATE_FRACTION:
+            return None
+        return candidates
+
+    def _get_postings(self) -> Dict[str, np.ndarray]:
+        """Word -> sorted verse indices, built on first use."""
+        if self._postings is None:
+            postings: Dict[str, array] = {}
+            for i, text in enumerate(self._verses.text):
+                for word in set(_WORD_RE.findall(text.lower())):
+                    indices = postings.get(word)
+                    if indices is None:
+                        postings[word] = indices = array('i')
+                    indices.append(i)
+
+            self._postings = {
+                word: np.frombuffer(indices, dtype=np.int32)
+                for word, indices in postings.items()
+            }
+        return self._postings
 
 
 class SemanticSearch:
     """Semantic search using embeddings and vector database."""
 
+    # Token-count upper bounds for encode_bucketed(); the last bucket is open
+    BUCKET_BOUNDS = (16, 32, 64)
+
+    # O3-optimized graph published alongside the default model on the Hub
+    ONNX_FILE_NAME = "onnx/model_O3.onnx"
+
+    # Directory under db_path holding int8-quantized ONNX exports
+    ONNX_CACHE_DIR = "onnx"
+
+    # Encoder batch size for index_scriptures(). Verses are encoded shortest
+    # first, so large batches add little padding and keep a GPU busy.
+    INDEX_BATCH_SIZE = 1024
+
+    # Number of recent query embeddings kept by search()
+    QUERY_CACHE_SIZE = 1024
+
+    # search() reuses the results of a recent query whose embedding has at
+    # least this cosine similarity, skipping the vector database; the oldest
+    # of RESULT_CACHE_SIZE entries is evicted first
+    RESULT_CACHE_SIZE = 1024
+    RESULT_CACHE_THRESHOLD = 0.97
+
+    COLLECTION_NAME = "scriptures"
+    # Chroma's "cosine" distance is 1 - cosine similarity, so search() can
+    # report 1 - distance directly. Embeddings are also stored L2-normalized,
+    # which keeps that exact for any client that queries with inner product.
+    COLLECTION_METADATA = {
+        "description": "Scripture verses with embeddings",
+        "hnsw:space": "cosine"
+    }
+
     def __init__(
         self,
         loader: ScriptureLoader,
         model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
-        db_path: Optional[str] = None
+        db_path: Optional[str] = None,
+        backend: str = "sentence-transformers",
+        use_faiss: bool = False,
+        quantize: bool = False
     ):
         """
         Initialize semantic search.
@@ -149,13 +387,46 @@ class SemanticSearch:
             loader: Scripture loader
             model_name: Name of the embedding model
             db_path: Path to vector database (ChromaDB)
+            backend: Embedding backend, "sentence-transformers", "onnx"
+                (optimized ONNX Runtime graph), "onnx-int8" (dynamically
+                quantized ONNX export, cached under db_path) or "fastembed"
+                (quantized ONNX models, faster on CPU)
+            use_faiss: Answer queries from an in-memory FAISS inner-product
+                index loaded from the collection, instead of querying Chroma
+            quantize: Hold the FAISS index as 8-bit scalar-quantized vectors,
+                a quarter of the memory at the cost of slightly approximate
+                scores; the collection itself keeps float32 embeddings
         """
+        if backend not in ("sentence-transformers", "onnx", "onnx-int8", "fastembed"):
+            raise ValueError(f"Unknown embedding backend: {backend}")
+        if backend == "onnx-int8" and not db_path:
+            raise ValueError("The onnx-int8 backend needs a db_path to cache its export")
+        if quantize and not use_faiss:
+            raise ValueError("quantize applies to the FAISS index; set use_faiss as well")
+
         self.loader = loader
         self.model_name = model_name
         self.db_path = db_path
+        self.backend = backend
+        self.use_faiss = use_faiss
+        self.quantize = quantize
         self.embedder = None
+        self.client = None
         self.collection = None
         self._initialized = False
+        # Whether the collection holds verses; once true it stays true until
+        # reset_collection(), so is_indexed() stops asking Chroma
+        self._has_index = False
+        # (index, documents, metadatas) when use_faiss is set, built on first search
+        self._faiss = None
+        # Per instance, so cached embeddings never outlive their model
+        self._encode_query = lru_cache(maxsize=self.QUERY_CACHE_SIZE)(self._embed_query)
+        # Ring buffer of recent (query embedding, n_results, results), built
+        # on the first search once the embedding width is known
+        self._cache_vecs: Optional[np.ndarray] = None
+        self._cache_n_results = np.zeros(self.RESULT_CACHE_SIZE, dtype=np.int32)
+        self._cache_results: List[List[SearchResult]] = []
+        self._cache_next = 0
 
     def initialize(self) -> None:
         """Initialize the embedding model and vector database."""
@@ -172,66 +443,304 @@ class SemanticSearch:
             ) from e
 
         # Initialize embedding model
-        self.embedder = SentenceTransformer(self.model_name)
+        if self.backend == "fastembed":
+            try:
+                from fastembed import TextEmbedding
+            except ImportError as e:
+                raise ImportError(
+                    "The fastembed backend requires fastembed. "
+                    "Install with: uv pip install -e '.[fastembed]'"
+                ) from e
+            self.embedder = TextEmbedding(
+                model_name=self.model_name,
+                threads=os.cpu_count()
+            )
+        elif self.backend in ("onnx", "onnx-int8"):
+            try:
+                import optimum.onnxruntime  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    f"The {self.backend} backend requires optimum and onnxruntime. "
+                    "Install with: uv pip install -e '.[onnx]'"
+                ) from e
+            if self.backend == "onnx-int8":
+                self.embedder = self._load_quantized_onnx(SentenceTransformer)
+            else:
+                self.embedder = SentenceTransformer(
+                    self.model_name,
+                    backend="onnx",
+                    model_kwargs={"file_name": self.ONNX_FILE_NAME}
+                )
+        else:
+            import torch
+
+            if torch.cuda.is_available():
+                # Half precision halves memory traffic on GPU; encode() still
+                # returns float32 for the vector database
+                self.embedder = SentenceTransformer(
+                    self.model_name,
+                    device="cuda",
+                    model_kwargs={"torch_dtype": torch.float16}
+                )
+            else:
+                self.embedder = SentenceTransformer(self.model_name)
 
         # Initialize ChromaDB
         if self.db_path:
-            client = chromadb.PersistentClient(path=self.db_path)
+            self.client = chromadb.PersistentClient(path=self.db_path)
         else:
-            client = chromadb.Client()
+            self.client = chromadb.Client()
 
         # Get or create collection
-        self.collection = client.get_or_create_collection(
-            name="scriptures",
-            metadata={"description": "Scripture verses with embeddings"}
+        self.collection = self.client.get_or_create_collection(
+            name=self.COLLECTION_NAME,
+            metadata=self.COLLECTION_METADATA
         )
+        self._has_index = self.collection.count() > 0
 
         self._initialized = True
 
-    def index_scriptures(self, force_reindex: bool = False) -> None:
-        """Index all scriptures into the vector database."""
+    def is_indexed(self) -> bool:
+        """Whether the collection holds any verses.
+
+        Only queries Chroma while the collection is empty, since another
+        process may be filling it.
+        """
         if not self._initialized:
             self.initialize()
 
-        # Check if already indexed
-        if not force_reindex and self.collection.count() > 0:
-            print(f"Collection already contains {self.collection.count()} verses")
-            return
+        if not self._has_index:
+            self._has_index = self.collection.count() > 0
+        return self._has_index
 
-        verses = self.loader.load_all_verses()
-        print(f"Indexing {len(verses)} verses...")
-
-        batch_size = 100
-        for i in range(0, len(verses), batch_size):
-            batch = verses[i:i + batch_size]
-
-            texts = [v.text for v in batch]
-            embeddings = self.embedder.encode(texts, show_progress_bar=True)
-
-            # Prepare metadata
-            metadatas = [
-                {
-                    "reference": v.reference,
-                    "short_reference": v.short_reference,
-                    "book_name": v.book_name,
-                    "chapter": str(v.chapter),
-                    "verse": str(v.verse),
-                    "volume": v.volume
-                }
-                for v in batch
-            ]
+    def _load_quantized_onnx(self, SentenceTransformer):
+        """Load the int8 ONNX export of the model, exporting it on first use.
 
-            # Generate IDs
-            ids = [f"{v.book_id}_{v.chapter}_{v.verse}" for v in batch]
+        Quantization takes a while, so the result is saved under db_path
+        and later starts load it directly.
+        """
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        # arm64 and avx2 configs both run on any CPU of their architecture
+        config = "arm64" if platform.machine().lower() in ("arm64", "aarch64") else "avx2"
+        file_name = f"onnx/model_qint8_{config}.onnx"
+        save_dir = Path(self.db_path) / self.ONNX_CACHE_DIR / self.model_name.replace("/", "--")
+
+        if not (save_dir / file_name).exists():
+            model = SentenceTransformer(self.model_name, backend="onnx")
+            model.save(str(save_dir))
+            export_dynamic_quantized_onnx_model(model, config, str(save_dir))
+
+        return SentenceTransformer(
+            str(save_dir),
+            backend="onnx",
+            model_kwargs={"file_name": file_name}
+        )
 
-            # Add to collection
-            self.collection.add(
-                embeddings=embeddings.tolist(),
-                documents=texts,
-                metadatas=metadatas,
-                ids=ids
+    def reset_collection(self) -> None:
+        """Drop and recreate the collection.
+
+        Chroma fixes a collection's distance metric at creation, so this is
+        also how an index built with an older metric picks up the current one.
+        """
+        if not self._initialized:
+            self.initialize()
+
+        self._faiss = None
+        self._has_index = False
+        self._clear_result_cache()
+        self.client.delete_collection(name=self.COLLECTION_NAME)
+        self.collection = self.client.create_collection(
+            name=self.COLLECTION_NAME,
+            metadata=self.COLLECTION_METADATA
+        )
+
+    def encode(
+        self,
+        texts: List[str],
+        batch_size: int = 256,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """
+        Embed texts with the configured backend.
+
+        Returns:
+            float32 array of shape (len(texts), dim) with L2-normalized rows
+        """
+        if not self._initialized:
+            self.initialize()
+
+        if self.backend == "fastembed":
+            # parallel=0 fans out to one worker per core; only worth the
+            # process start-up cost for bulk encodes, not single queries.
+            parallel = 0 if len(texts) > batch_size else None
+            embeddings = list(self.embedder.embed(
+                texts,
+                batch_size=batch_size,
+                parallel=parallel
+            ))
+        else:
+            embeddings = self.embedder.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=show_progress_bar,
+                convert_to_numpy=True,
+                normalize_embeddings=True
             )
 
+        return np.asarray(embeddings, dtype=np.float32)
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Embed a single query; the result is read-only as it may be cached."""
+        embedding = self.encode([query])[0]
+        embedding.flags.writeable = False
+        return embedding
+
+    def encode_bucketed(self, texts: List[str], batch_size: int = 256) -> np.ndarray:
+        """
+        Embed texts by calling the tokenizer and transformer directly.
+
+        Everything is tokenized once, then grouped into token-length buckets
+        so each forward pass pads only to the longest text in its bucket.
+        Token embeddings are mean-pooled, L2-normalized and scattered back
+        into input order. Falls back to encode() unless the model is exactly
+        the Transformer -> mean Pooling (-> Normalize) pipeline this
+        reimplements; a Dense layer or another pooling mode would otherwise
+        be silently skipped.
+
+        Returns:
+            float32 array of shape (len(texts), dim) with L2-normalized rows
+        """
+        if not self._initialized:
+            self.initialize()
+
+        if not self._mean_pooled():
+            return self.encode(texts, batch_size=batch_size)
+
+        import torch
+
+        transformer = self.embedder[0]
+        tokenizer = transformer.tokenizer
+        model = transformer.auto_model
+
+        encoded = tokenizer(
+            list(texts),
+            truncation=True,
+            max_length=transformer.max_seq_length
+        )
+        lengths = np.array([len(ids) for ids in encoded["input_ids"]])
+        buckets = np.digitize(lengths, self.BUCKET_BOUNDS, right=True)
+
+        dim = self.embedder.get_sentence_embedding_dimension()
+        embeddings = np.empty((len(texts), dim), dtype=np.float32)
+
+        with torch.inference_mode():
+            for bucket in range(len(self.BUCKET_BOUNDS) + 1):
+                indices = np.flatnonzero(buckets == bucket)
+                indices = indices[np.argsort(lengths[indices], kind="stable")]
+
+                for start in range(0, len(indices), batch_size):
+                    batch = indices[start:start + batch_size]
+                    features = tokenizer.pad(
+                        {key: [encoded[key][i] for i in batch] for key in encoded.keys()},
+                        return_tensors="pt"
+                    ).to(self.embedder.device)
+
+                    hidden = model(**features).last_hidden_state
+                    mask = features["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+                    pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+                    pooled = torch.nn.functional.normalize(pooled.float(), p=2, dim=1)
+                    embeddings[batch] = pooled.cpu().numpy()
+
+        return embeddings
+
+    def _mean_pooled(self) -> bool:
+        """Whether the model is Transformer -> mean Pooling, optionally -> Normalize."""
+        if self.backend != "sentence-transformers":
+            return False
+
+        names = [type(module).__name__ for module in self.embedder]
+        if names not in (["Transformer", "Pooling"], ["Transformer", "Pooling", "Normalize"]):
+            return False
+
+        # get_pooling_mode_str() before sentence-transformers 6, pooling_mode since
+        pooling = self.embedder[1]
+        get_mode = getattr(pooling, "get_pooling_mode_str", None)
+        mode = get_mode() if get_mode is not None else getattr(pooling, "pooling_mode", None)
+        return mode == "mean"
+
+    def index_scriptures(self, force_reindex: bool = False, resume: bool = False) -> None:
+        """
+        Index all scriptures into the vector database.
+
+        Args:
+            force_reindex: Drop the collection and index every verse again
+            resume: Continue a partial index from an interrupted run, only
+                embedding the verses that are not stored yet
+        """
+        if not self._initialized:
+            self.initialize()
+
+        count = self.collection.count()
+        if force_reindex:
+            self.reset_collection()
+            count = 0
+        elif count > 0 and not resume:
+            print(f"Collection already contains {count} verses")
+            return
+
+        verses = self.loader.load_all_verses()
+        total = len(verses)
+        print(f"Indexing {total} verses...")
+
+        # Encode in order of text length so each batch pads to similar
+        # lengths; row order does not matter to the vector database
+        lengths = np.fromiter((len(text) for text in verses.text), dtype=np.int64, count=total)
+        order = np.argsort(lengths, kind='stable').tolist()
+        ids = verses.ids
+        metadatas = verses.metadatas
+
+        # Encode in chunks of the largest add() Chroma accepts, writing each
+        # chunk on a background thread while the next one is encoded. At
+        # most two writes are pending, which bounds memory; a single worker
+        # keeps the writes in order.
+        add_batch_size = min(5000, self.client.get_max_batch_size())
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            for i in range(0, total, add_batch_size):
+                batch = order[i:i + add_batch_size]
+                done = i + len(batch)
+                print(f"  Progress: {done:,}/{total:,} verses ({done / total * 100:.1f}%)", end="\r")
+
+                if count > 0:
+                    # Skip the forward pass for verses already stored
+                    stored = set(self.collection.get(ids=[ids[j] for j in batch], include=[])["ids"])
+                    batch = [j for j in batch if ids[j] not in stored]
+                    if not batch:
+                        continue
+
+                batch_texts = [verses.text[j] for j in batch]
+                # One encode call per chunk lets the encoder batch internally
+                embeddings = self.encode_bucketed(batch_texts, batch_size=self.INDEX_BATCH_SIZE)
+
+                if len(pending) == 2:
+                    pending.popleft().result()
+                pending.append(writer.submit(
+                    self.collection.add,
+                    embeddings=embeddings,
+                    documents=batch_texts,
+                    metadatas=[metadatas[j] for j in batch],
+                    ids=[ids[j] for j in batch]
+                ))
+
+            # Surface any write error
+            for future in pending:
+                future.result()
+        print()
+
+        self._faiss = None
+        self._has_index = total > 0
+        self._clear_result_cache()
         print(f"Indexing complete. Total verses: {self.collection.count()}")
 
     def search(
@@ -257,57 +766,227 @@ class SemanticSearch:
         if not query or not query.strip():
             return []
 
-        # Generate query embedding
-        query_embedding = self.embedder.encode([query])[0]
+        # Generate query embedding; repeated queries that differ only in
+        # whitespace reuse the cached one
+        query_embedding = self._encode_query(" ".join(query.split()))
+
+        results = self._cached_results(query_embedding, n_results)
+        if results is None:
+            results = self._query(query_embedding[None, :], n_results)[0]
+            self._remember_results(query_embedding, n_results, results)
+        return list(results)
+
+    def search_batch(
+        self,
+        queries: List[str],
+        n_results: int = 10
+    ) -> List[List[SearchResult]]:
+        """
+        Perform semantic search for several queries at once.
+
+        The queries are embedded in a single encode call and looked up in a
+        single vector-database query, which is cheaper than calling search()
+        per query when several requests arrive together.
+
+        Args:
+            queries: Search queries
+            n_results: Number of results to return per query
+
+        Returns:
+            One list of SearchResult objects per query, in query order
+        """
+        if not self._initialized:
+            self.initialize()
+
+        normalized = [" ".join(query.split()) if query else "" for query in queries]
+        active = [i for i, query in enumerate(normalized) if query]
+
+        results: List[List[SearchResult]] = [[] for _ in queries]
+        if not active:
+            return results
+
+        embeddings = self.encode(
+            [normalized[i] for i in active],
+            batch_size=len(active)
+        )
+        for i, query_results in zip(active, self._query(embeddings, n_results)):
+            results[i] = query_results
+        return results
+
+    def _cached_results(
+        self,
+        embedding: np.ndarray,
+        n_results: int
+    ) -> Optional[List[SearchResult]]:
+        """Results of the most similar cached query, if it is close enough."""
+        if not self._cache_results:
+            return None
+
+        # Unit vectors, so one matrix-vector product gives every cosine
+        filled = len(self._cache_results)
+        sims = self._cache_vecs[:filled] @ embedding
+        # Only entries that fetched at least n_results can answer this query
+        sims[self._cache_n_results[:filled] < n_results] = -1.0
+        best = int(np.argmax(sims))
+        if sims[best] < self.RESULT_CACHE_THRESHOLD:
+            return None
+        return self._cache_results[best][:n_results]
+
+    def _remember_results(
+        self,
+        embedding: np.ndarray,
+        n_results: int,
+        results: List[SearchResult]
+    ) -> None:
+        """Add a query's results to the cache, evicting the oldest entry when full."""
+        if self._cache_vecs is None:
+            self._cache_vecs = np.empty((self.RESULT_CACHE_SIZE, len(embedding)), dtype=np.float32)
+
+        slot = self._cache_next
+        self._cache_vecs[slot] = embedding
+        self._cache_n_results[slot] = n_results
+        if slot < len(self._cache_results):
+            self._cache_results[slot] = results
+        else:
+            self._cache_results.append(results)
+        self._cache_next = (slot + 1) % self.RESULT_CACHE_SIZE
+
+    def _clear_result_cache(self) -> None:
+        """Forget cached results, e.g. after the collection changes."""
+        self._cache_results = []
+        self._cache_next = 0
+
+    def _query(self, embeddings: np.ndarray, n_results: int) -> List[List[SearchResult]]:
+        """Look up each row of a query embedding matrix."""
+        if self.use_faiss:
+            index, documents, metadatas = self._get_faiss_index()
+            # Inner product of unit vectors is the cosine similarity
+            scores, rows = index.search(np.ascontiguousarray(embeddings), n_results)
+
+            results = []
+            for row_list, score_list in zip(rows.tolist(), scores.tolist()):
+                hits = [(row, score) for row, score in zip(row_list, score_list) if row >= 0]
+                results.append(self._build_results(
+                    [metadatas[row] for row, _ in hits],
+                    [documents[row] for row, _ in hits],
+                    [score for _, score in hits]
+                ))
+            return results
 
         # Search in vector database
-        results = self.collection.query(
-            query_embeddings=[query_embedding.tolist()],
+        response = self.collection.query(
+            query_embeddings=embeddings.tolist(),
             n_results=n_results
         )
 
-        # Convert to SearchResult objects
-        search_results = []
-        for i in range(len(results['ids'][0])):
-            metadata = results['metadatas'][0][i]
-            document = results['documents'][0][i]
-            distance = results['distances'][0][i] if 'distances' in results else None
-
-            # Calculate similarity score (1 - distance for cosine)
-            score = 1 - distance if distance is not None else None
+        distances = response.get('distances')
+        results = []
+        for k, ids in enumerate(response['ids']):
+            # Similarity scores (cosine distance is 1 - cosine), in one vector op
+            if distances:
+                scores = (1.0 - np.asarray(distances[k], dtype=np.float64)).tolist()
+            else:
+                scores = [None] * len(ids)
+
+            results.append(self._build_results(
+                response['metadatas'][k],
+                response['documents'][k],
+                scores
+            ))
+        return results
 
-            # Create context (for semantic search, we can show the full verse)
-            context = document[:150] + "..." if len(document) > 150 else document
+    def _get_faiss_index(self) -> Tuple[Any, List[str], List[Dict[str, Any]]]:
+        """
+        Load the collection into a FAISS index, once.
 
-            result = SearchResult(
+        Exact inner-product search over the stored unit vectors, held in
+        memory so queries skip Chroma's HNSW and sqlite reads. With quantize
+        set the vectors are stored as int8 with a trained range per
+        dimension, which scans a quarter of the bytes per query.
+        """
+        if self._faiss is None:
+            try:
+                import faiss
+            except ImportError as e:
+                raise ImportError(
+                    "use_faiss requires faiss. "
+                    "Install with: uv pip install -e '.[faiss]'"
+                ) from e
+
+            stored = self.collection.get(include=["embeddings", "documents", "metadatas"])
+            embeddings = np.ascontiguousarray(stored["embeddings"], dtype=np.float32)
+            if self.quantize:
+                index = faiss.IndexScalarQuantizer(
+                    embeddings.shape[1],
+                    faiss.ScalarQuantizer.QT_8bit,
+                    faiss.METRIC_INNER_PRODUCT
+                )
+                index.train(embeddings)
+            else:
+                index = faiss.IndexFlatIP(embeddings.shape[1])
+            index.add(embeddings)
+            self._faiss = (index, stored["documents"], stored["metadatas"])
+        return self._faiss
+
+    @staticmethod
+    def _build_results(
+        metadatas: List[Dict[str, Any]],
+        documents: List[str],
+        scores: List[Optional[float]]
+    ) -> List[SearchResult]:
+        """Build results from stored metadata, documents and similarity scores."""
+        # For semantic search the context is the start of the verse
+        return [
+            SearchResult(
                 reference=metadata['reference'],
                 short_reference=metadata['short_reference'],
                 verse_text=document,
-                context=context,
+                context=document[:150] + "..." if len(document) > 150 else document,
                 book_name=metadata['book_name'],
                 chapter=int(metadata['chapter']),
                 verse=int(metadata['verse']),
                 volume=metadata['volume'],
                 score=score
             )
-            search_results.append(result)
+            for metadata, document, score in zip(metadatas, documents, scores)
+        ]
 
-        return search_results
+
+# JSON keys for each SearchResult field, in field order
+RESULT_KEYS = (
+    "reference",
+    "shortReference",
+    "verseText",
+    "context",
+    "bookName",
+    "chapter",
+    "verse",
+    "volume",
+    "score",
+)
 
 
 def format_search_results(results: List[SearchResult]) -> List[Dict[str, Any]]:
     """Format search results as JSON-serializable dictionaries."""
     return [
-        {
-            "reference": r.reference,
-            "shortReference": r.short_reference,
-            "verseText": r.verse_text,
-            "context": r.context,
-            "bookName": r.book_name,
-            "chapter": r.chapter,
-            "verse": r.verse,
-            "volume": r.volume,
-            "score": r.score
-        }
+        dict(zip(RESULT_KEYS, (
+            r.reference,
+            r.short_reference,
+            r.verse_text,
+            r.context,
+            r.book_name,
+            r.chapter,
+            r.verse,
+            r.volume,
+            r.score
+        )))
         for r in results
     ]
+
+
+def dumps_search_results(results: List[SearchResult]) -> str:
+    """Serialize search results to indented JSON."""
+    return orjson.dumps(
+        format_search_results(results),
+        option=orjson.OPT_INDENT_2
+    ).decode('utf-8')
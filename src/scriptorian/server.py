@@ -1,22 +1,93 @@
 """MCP server for scripture study."""
 
+import asyncio
 import json
 import difflib
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Dict, Tuple
+from typing import Any, Iterable, List, Dict, Optional, Tuple
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
 
 from .data_loader import ScriptureLoader, Verse
 from .reference_parser import ReferenceParser, ParsedReference
-from .search import ExactSearch, SemanticSearch, format_search_results
+from .search import ExactSearch, SemanticSearch, dumps_search_results
+
+
+# Long tool output is split into TextContent blocks of about this many
+# characters, so clients can render a large passage as it arrives
+OUTPUT_CHUNK_SIZE = 4096
+
+
+# Closing key for compare_scripture's inline diff markup
+_COMPARE_LEGEND = (
+    "**Legend:**\n"
+    "- `[-text-]` = removed from first passage\n"
+    "- `[+text+]` = added in second passage\n"
+    "- `[-old-] → [+new+]` = replacement\n"
+)
+
+
+def _text_chunks(parts: Iterable[str], chunk_size: int = OUTPUT_CHUNK_SIZE) -> List[TextContent]:
+    """
+    Pack output parts into TextContent blocks of about chunk_size characters.
+
+    Parts are never split, so each verse or hit stays within one block and
+    concatenating the blocks gives the full output.
+    """
+    chunks = []
+    buffer: List[str] = []
+    size = 0
+    for part in parts:
+        if buffer and size + len(part) > chunk_size:
+            chunks.append(TextContent(type="text", text="".join(buffer)))
+            buffer, size = [], 0
+        buffer.append(part)
+        size += len(part)
+
+    if buffer:
+        chunks.append(TextContent(type="text", text="".join(buffer)))
+    return chunks
+
+
+def _word_opcodes(words1: List[str], words2: List[str]) -> List[Tuple[str, int, int, int, int]]:
+    """
+    Word-level diff of two word lists as difflib-style opcodes.
+
+    Words shared at the start and end are matched up front, so only the
+    differing middle reaches SequenceMatcher. Parallel passages usually
+    agree over long stretches, and SequenceMatcher's cost grows with
+    everything it is given.
+    """
+    n1, n2 = len(words1), len(words2)
+    limit = min(n1, n2)
+
+    prefix = 0
+    while prefix < limit and words1[prefix] == words2[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and words1[n1 - 1 - suffix] == words2[n2 - 1 - suffix]:
+        suffix += 1
+
+    opcodes = [("equal", 0, prefix, 0, prefix)] if prefix else []
+    matcher = difflib.SequenceMatcher(None, words1[prefix:n1 - suffix], words2[prefix:n2 - suffix])
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        opcodes.append((tag, i1 + prefix, i2 + prefix, j1 + prefix, j2 + prefix))
+    if suffix:
+        opcodes.append(("equal", n1 - suffix, n1, n2 - suffix, n2))
+    return opcodes
 
 
 class ScripturianServer:
     """MCP Server for scripture study tools."""
 
-    def __init__(self, data_path: Path, vector_db_path: Path):
+    def __init__(
+        self,
+        data_path: Path,
+        vector_db_path: Path,
+        embedding_backend: str = "sentence-transformers"
+    ):
         """Initialize the server."""
         self.app = Server("scriptorian")
         self.data_path = data_path
@@ -28,220 +99,275 @@ class ScripturianServer:
 
         self.parser = ReferenceParser()
         self.exact_search = ExactSearch(self.loader)
+
+        # Repeated references skip parsing and chapter file reads. Verses are
+        # frozen and returned as tuples, so cached results cannot be mutated.
+        self._resolve = lru_cache(maxsize=1024)(self._resolve_reference)
+        self._load_chapter = lru_cache(maxsize=256)(self._load_chapter_verses)
         self.semantic_search = SemanticSearch(
             self.loader,
             model_name="sentence-transformers/all-MiniLM-L6-v2",
-            db_path=str(vector_db_path)
+            db_path=str(vector_db_path),
+            backend=embedding_backend
         )
 
+        # Tool definitions never change, so every tools/list request
+        # (one per new session) returns this same list
+        self._tools = self._build_tools()
+        self._handlers = {
+            "fetch_scripture": self._fetch_scripture,
+            "parse_reference": self._parse_reference,
+            "exact_search": self._exact_search,
+            "semantic_search": self._semantic_search,
+            "index_scriptures": self._index_scriptures,
+            "compare_scripture": self._compare_scripture,
+        }
+
         # Register tools
         self._register_tools()
 
-    def _register_tools(self):
-        """Register all MCP tools."""
-
-        @self.app.list_tools()
-        async def list_tools() -> List[Tool]:
-            """List available tools."""
-            return [
-                Tool(
-                    name="fetch_scripture",
-                    description=(
-                        "Fetch scripture verses from a natural language reference. "
-                        "Supports formats like '1 Ne 3:7', 'Alma 32:21-23', "
-                        "'John 3:16', 'D&C 121:1-6', etc. Returns the full text "
-                        "of the requested verses in standard format."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "reference": {
-                                "type": "string",
-                                "description": (
-                                    "Scripture reference in natural language "
-                                    "(e.g., '1 Ne 3:7-8', 'Alma 32', 'John 3:16')"
-                                )
-                            }
-                        },
-                        "required": ["reference"]
-                    }
+    def _build_tools(self) -> List[Tool]:
+        """Describe the MCP tools."""
+        return [
+            Tool(
+                name="fetch_scripture",
+                description=(
+                    "Fetch scripture verses from a natural language reference. "
+                    "Supports formats like '1 Ne 3:7', 'Alma 32:21-23', "
+                    "'John 3:16', 'D&C 121:1-6', etc. Returns the full text "
+                    "of the requested verses in standard format."
                 ),
-                Tool(
-                    name="parse_reference",
-                    description=(
-                        "Parse a plain text scripture reference into structured format. "
-                        "Returns JSON with book, chapter, and verse information."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "reference": {
-                                "type": "string",
-                                "description": "Plain text reference to parse"
-                            }
-                        },
-                        "required": ["reference"]
-                    }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "reference": {
+                            "type": "string",
+                            "description": (
+                                "Scripture reference in natural language "
+                                "(e.g., '1 Ne 3:7-8', 'Alma 32', 'John 3:16')"
+                            )
+                        }
+                    },
+                    "required": ["reference"]
+                }
+            ),
+            Tool(
+                name="parse_reference",
+                description=(
+                    "Parse a plain text scripture reference into structured format. "
+                    "Returns JSON with book, chapter, and verse information."
                 ),
-                Tool(
-                    name="exact_search",
-                    description=(
-                        "Search for an exact string across all scriptures. "
-                        "Returns matching verses with context highlighting the match."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Text to search for"
-                            },
-                            "case_sensitive": {
-                                "type": "boolean",
-                                "description": "Whether search is case-sensitive",
-                                "default": False
-                            },
-                            "max_results": {
-                                "type": "integer",
-                                "description": "Maximum number of results",
-                                "default": 50
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "reference": {
+                            "type": "string",
+                            "description": "Plain text reference to parse"
+                        }
+                    },
+                    "required": ["reference"]
+                }
+            ),
+            Tool(
+                name="exact_search",
+                description=(
+                    "Search for an exact string across all scriptures. "
+                    "Returns matching verses with context highlighting the match."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Text to search for"
                         },
-                        "required": ["query"]
-                    }
+                        "case_sensitive": {
+                            "type": "boolean",
+                            "description": "Whether search is case-sensitive",
+                            "default": False
+                        },
+                        "max_results": {
+                            "type": "integer",
+                            "description": "Maximum number of results",
+                            "default": 50
+                        }
+                    },
+                    "required": ["query"]
+                }
+            ),
+            Tool(
+                name="semantic_search",
+                description=(
+                    "Perform semantic search across scriptures using AI embeddings. "
+                    "Finds verses similar in meaning to the query, not just exact matches. "
+                    "Note: First use requires indexing which may take a few minutes."
                 ),
-                Tool(
-                    name="semantic_search",
-                    description=(
-                        "Perform semantic search across scriptures using AI embeddings. "
-                        "Finds verses similar in meaning to the query, not just exact matches. "
-                        "Note: First use requires indexing which may take a few minutes."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Search query (phrase or question)"
-                            },
-                            "n_results": {
-                                "type": "integer",
-                                "description": "Number of results to return",
-                                "default": 10
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Search query (phrase or question)"
                         },
-                        "required": ["query"]
-                    }
+                        "n_results": {
+                            "type": "integer",
+                            "description": "Number of results to return",
+                            "default": 10
+                        }
+                    },
+                    "required": ["query"]
+                }
+            ),
+            Tool(
+                name="index_scriptures",
+                description=(
+                    "Index all scriptures for semantic search. "
+                    "This needs to be run once before using semantic_search. "
+                    "May take several minutes."
                 ),
-                Tool(
-                    name="index_scriptures",
-                    description=(
-                        "Index all scriptures for semantic search. "
-                        "This needs to be run once before using semantic_search. "
-                        "May take several minutes."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "force_reindex": {
-                                "type": "boolean",
-                                "description": "Force reindexing even if already indexed",
-                                "default": False
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "force_reindex": {
+                            "type": "boolean",
+                            "description": "Force reindexing even if already indexed",
+                            "default": False
                         }
                     }
+                }
+            ),
+            Tool(
+                name="compare_scripture",
+                description=(
+                    "Compare two scripture passages and show their differences. "
+                    "Useful for comparing parallel passages (e.g., Matthew 5 vs 3 Nephi 12), "
+                    "similar texts (e.g., sacramental prayers), or different versions. "
+                    "Returns a unified diff showing additions, deletions, and changes."
                 ),
-                Tool(
-                    name="compare_scripture",
-                    description=(
-                        "Compare two scripture passages and show their differences. "
-                        "Useful for comparing parallel passages (e.g., Matthew 5 vs 3 Nephi 12), "
-                        "similar texts (e.g., sacramental prayers), or different versions. "
-                        "Returns a unified diff showing additions, deletions, and changes."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "reference1": {
-                                "type": "string",
-                                "description": "First scripture reference (e.g., 'Moroni 4:3', 'Matthew 5')"
-                            },
-                            "reference2": {
-                                "type": "string",
-                                "description": "Second scripture reference (e.g., 'D&C 20:77', '3 Nephi 12')"
-                            },
-                            "context_lines": {
-                                "type": "integer",
-                                "description": "Number of context lines to show around differences",
-                                "default": 3
-                            }
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "reference1": {
+                            "type": "string",
+                            "description": "First scripture reference (e.g., 'Moroni 4:3', 'Matthew 5')"
                         },
-                        "required": ["reference1", "reference2"]
-                    }
-                )
-            ]
+                        "reference2": {
+                            "type": "string",
+                            "description": "Second scripture reference (e.g., 'D&C 20:77', '3 Nephi 12')"
+                        },
+                        "context_lines": {
+                            "type": "integer",
+                            "description": "Number of context lines to show around differences",
+                            "default": 3
+                        }
+                    },
+                    "required": ["reference1", "reference2"]
+                }
+            ),
+            Tool(
+                name="batch_execute",
+                description=(
+                    "Run several of the other tools in one request, e.g. "
+                    "parse_reference, fetch_scripture and compare_scripture "
+                    "together. Returns each call's output in order, under a "
+                    "heading naming the call."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "calls": {
+                            "type": "array",
+                            "description": "Tool calls to run",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {
+                                        "type": "string",
+                                        "description": "Name of the tool to call"
+                                    },
+                                    "arguments": {
+                                        "type": "object",
+                                        "description": "Arguments for the tool",
+                                        "default": {}
+                                    }
+                                },
+                                "required": ["name"]
+                            }
+                        }
+                    },
+                    "required": ["calls"]
+                }
+            )
+        ]
+
+    def _register_tools(self):
+        """Register all MCP tools."""
+
+        @self.app.list_tools()
+        async def list_tools() -> List[Tool]:
+            """List available tools; built once in __init__."""
+            return self._tools
 
         @self.app.call_tool()
         async def call_tool(name: str, arguments: Any) -> List[TextContent]:
             """Handle tool calls."""
-            try:
-                if name == "fetch_scripture":
-                    return await self._fetch_scripture(arguments)
-                elif name == "parse_reference":
-                    return await self._parse_reference(arguments)
-                elif name == "exact_search":
-                    return await self._exact_search(arguments)
-                elif name == "semantic_search":
-                    return await self._semantic_search(arguments)
-                elif name == "index_scriptures":
-                    return await self._index_scriptures(arguments)
-                elif name == "compare_scripture":
-                    return await self._compare_scripture(arguments)
-                else:
-                    return [TextContent(
-                        type="text",
-                        text=f"Unknown tool: {name}"
-                    )]
-            except Exception as e:
-                return [TextContent(
-                    type="text",
-                    text=f"Error executing {name}: {str(e)}"
-                )]
+            if name == "batch_execute":
+                return await self._batch_execute(arguments)
+            return await self._call_tool(name, arguments)
+
+    async def _call_tool(self, name: str, arguments: Any) -> List[TextContent]:
+        """Run one tool, reporting any error as text."""
+        handler = self._handlers.get(name)
+        if handler is None:
+            return [TextContent(
+                type="text",
+                text=f"Unknown tool: {name}"
+            )]
 
-    async def _fetch_scripture(self, args: Dict[str, Any]) -> List[TextContent]:
-        """Fetch scripture verses from a reference."""
-        reference = args.get("reference", "")
+        try:
+            return await handler(arguments)
+        except Exception as e:
+            return [TextContent(
+                type="text",
+                text=f"Error executing {name}: {str(e)}"
+            )]
 
-        # Parse the reference
-        parsed = self.parser.parse(reference)
-        if not parsed.valid:
+    async def _batch_execute(self, args: Any) -> List[TextContent]:
+        """Run several tool calls in one request; batches do not nest."""
+        calls = args.get("calls") if isinstance(args, dict) else None
+        if not isinstance(calls, list) or not all(
+            isinstance(call, dict) and isinstance(call.get("name", ""), str)
+            for call in calls
+        ):
             return [TextContent(
                 type="text",
-                text=f"Invalid reference: {parsed.error}"
+                text="Error executing batch_execute: 'calls' must be a list of "
+                     "objects with a string 'name' and optional 'arguments'"
             )]
 
-        # Fetch verses
-        all_verses = []
-        for book_ref in parsed.references:
-            book = self.loader.get_book_by_abbr(book_ref.book)
-            if not book:
-                continue
+        # Unknown and nested batch_execute names fall through to "Unknown tool".
+        # The calls share one event loop, so handlers that compute inline run
+        # one after another; only work they hand to executor threads overlaps.
+        names = [call.get("name", "") for call in calls]
+        outputs = await asyncio.gather(*(
+            self._call_tool(name, call.get("arguments") or {})
+            for name, call in zip(names, calls)
+        ))
+
+        contents = []
+        for i, (name, output) in enumerate(zip(names, outputs), 1):
+            contents.append(TextContent(type="text", text=f"### {i}. {name}\n\n"))
+            contents.extend(output)
+        return contents
 
-            for chapter in book_ref.chapters:
-                for ch in range(chapter.start, chapter.end + 1):
-                    verses = self.loader.load_scripture_verses(book.id, ch)
+    async def _fetch_scripture(self, args: Dict[str, Any]) -> List[TextContent]:
+        """Fetch scripture verses from a reference."""
+        reference = args.get("reference", "")
 
-                    if chapter.verses:
-                        # Filter to specific verses
-                        for verse_seg in chapter.verses:
-                            filtered = [
-                                v for v in verses
-                                if verse_seg.start <= v.verse <= verse_seg.end
-                            ]
-                            all_verses.extend(filtered)
-                    else:
-                        # All verses in chapter
-                        all_verses.extend(verses)
+        try:
+            all_verses, pretty_string = self._resolve(reference)
+        except ValueError as e:
+            return [TextContent(type="text", text=str(e))]
 
         if not all_verses:
             return [TextContent(
@@ -250,11 +376,10 @@ class ScripturianServer:
             )]
 
         # Format output
-        output = f"**{parsed.pretty_string}**\n\n"
-        for verse in all_verses:
-            output += f"{verse.short_reference} {verse.text}\n\n"
+        parts = [f"**{pretty_string}**\n\n"]
+        parts.extend(f"{verse.short_reference} {verse.text}\n\n" for verse in all_verses)
 
-        return [TextContent(type="text", text=output)]
+        return _text_chunks(parts)
 
     async def _parse_reference(self, args: Dict[str, Any]) -> List[TextContent]:
         """Parse a scripture reference."""
@@ -285,15 +410,14 @@ class ScripturianServer:
             )]
 
         # Format output
-        output = f"**Found {len(results)} matches for '{query}'**\n\n"
-        for result in results:
-            output += f"**{result.short_reference}** - {result.context}\n\n"
+        parts = [f"**Found {len(results)} matches for '{query}'**\n\n"]
+        parts.extend(f"**{result.short_reference}** - {result.context}\n\n" for result in results)
 
         # Also return JSON
-        json_output = json.dumps(format_search_results(results), indent=2)
+        json_output = dumps_search_results(results)
 
         return [
-            TextContent(type="text", text=output),
+            *_text_chunks(parts),
             TextContent(type="text", text=f"\n\nJSON Results:\n{json_output}")
         ]
 
@@ -303,12 +427,8 @@ class ScripturianServer:
         n_results = args.get("n_results", 10)
 
         try:
-            # Initialize if needed
-            if not self.semantic_search._initialized:
-                self.semantic_search.initialize()
-
-            # Check if indexed
-            if self.semantic_search.collection.count() == 0:
+            # Initializes on first use; only asks Chroma until it is indexed
+            if not self.semantic_search.is_indexed():
                 return [TextContent(
                     type="text",
                     text=(
@@ -326,19 +446,19 @@ class ScripturianServer:
                 )]
 
             # Format output
-            output = f"**Semantic search results for '{query}'**\n\n"
+            parts = [f"**Semantic search results for '{query}'**\n\n"]
             for i, result in enumerate(results, 1):
                 score_str = f" (score: {result.score:.3f})" if result.score else ""
-                output += (
+                parts.append(
                     f"{i}. **{result.short_reference}**{score_str}\n"
                     f"   {result.verse_text}\n\n"
                 )
 
             # Also return JSON
-            json_output = json.dumps(format_search_results(results), indent=2)
+            json_output = dumps_search_results(results)
 
             return [
-                TextContent(type="text", text=output),
+                *_text_chunks(parts),
                 TextContent(type="text", text=f"\n\nJSON Results:\n{json_output}")
             ]
 
@@ -367,12 +487,16 @@ class ScripturianServer:
                 text=f"Indexing error: {str(e)}"
             )]
 
-    def _fetch_verses_for_reference(self, reference: str) -> Tuple[List[Verse], str]:
+    def _fetch_verses_for_reference(self, reference: str) -> Tuple[Tuple[Verse, ...], str]:
         """Helper method to fetch verses for a reference.
 
         Returns:
-            Tuple of (verses list, pretty reference string)
+            Tuple of (verses, pretty reference string)
         """
+        return self._resolve(reference)
+
+    def _resolve_reference(self, reference: str) -> Tuple[Tuple[Verse, ...], str]:
+        """Parse a reference and collect its verses; cached as self._resolve."""
         parsed = self.parser.parse(reference)
         if not parsed.valid:
             raise ValueError(f"Invalid reference: {parsed.error}")
@@ -385,21 +509,44 @@ class ScripturianServer:
 
             for chapter in book_ref.chapters:
                 for ch in range(chapter.start, chapter.end + 1):
-                    verses = self.loader.load_scripture_verses(book.id, ch)
+                    verses, first = self._load_chapter(book.id, ch)
 
                     if chapter.verses:
                         # Filter to specific verses
                         for verse_seg in chapter.verses:
-                            filtered = [
-                                v for v in verses
-                                if verse_seg.start <= v.verse <= verse_seg.end
-                            ]
-                            all_verses.extend(filtered)
+                            if first is not None:
+                                # Numbered consecutively, so verse n is at n - first
+                                start = max(verse_seg.start - first, 0)
+                                end = max(verse_seg.end - first + 1, 0)
+                                all_verses.extend(verses[start:end])
+                            else:
+                                all_verses.extend(
+                                    v for v in verses
+                                    if verse_seg.start <= v.verse <= verse_seg.end
+                                )
                     else:
                         # All verses in chapter
                         all_verses.extend(verses)
 
-        return all_verses, parsed.pretty_string
+        return tuple(all_verses), parsed.pretty_string
+
+    def _load_chapter_verses(
+        self,
+        book_id: int,
+        chapter: int
+    ) -> Tuple[Tuple[Verse, ...], Optional[int]]:
+        """Load one chapter; cached as self._load_chapter.
+
+        Also returns the first verse number if the verses are numbered
+        consecutively from it (some chapters start at 0), else None.
+        """
+        verses = tuple(self.loader.load_scripture_verses(book_id, chapter))
+        if not verses:
+            return verses, None
+
+        first = verses[0].verse
+        consecutive = all(v.verse == first + i for i, v in enumerate(verses))
+        return verses, first if consecutive else None
 
     async def _compare_scripture(self, args: Dict[str, Any]) -> List[TextContent]:
         """Compare two scripture passages and show their differences."""
@@ -408,9 +555,12 @@ class ScripturianServer:
         context_lines = args.get("context_lines", 3)
 
         try:
-            # Fetch both passages
-            verses1, pretty_ref1 = self._fetch_verses_for_reference(reference1)
-            verses2, pretty_ref2 = self._fetch_verses_for_reference(reference2)
+            # Fetch both passages; chapter reads overlap on worker threads
+            loop = asyncio.get_running_loop()
+            (verses1, pretty_ref1), (verses2, pretty_ref2) = await asyncio.gather(
+                loop.run_in_executor(None, self._fetch_verses_for_reference, reference1),
+                loop.run_in_executor(None, self._fetch_verses_for_reference, reference2)
+            )
 
             if not verses1:
                 return [TextContent(
@@ -432,36 +582,41 @@ class ScripturianServer:
             words1 = text1.split()
             words2 = text2.split()
 
-            # Use SequenceMatcher for word-level diff
-            matcher = difflib.SequenceMatcher(None, words1, words2)
+            # Word-level diff
+            opcodes = _word_opcodes(words1, words2)
 
-            # Build formatted output
-            output_lines = []
+            # One pass over the opcodes builds the change list, the inline
+            # markup and the word counts, joining each span only once
             additions = 0
             deletions = 0
             changes = []
+            result_parts = []
 
-            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            for tag, i1, i2, j1, j2 in opcodes:
                 if tag == 'equal':
                     # Words that are the same
+                    result_parts.append(' '.join(words1[i1:i2]))
                     continue
-                elif tag == 'delete':
+
+                if tag != 'insert':
                     # Words only in first passage
-                    deleted_words = words1[i1:i2]
-                    deletions += len(deleted_words)
-                    changes.append(f"[-{' '.join(deleted_words)}-]")
-                elif tag == 'insert':
+                    deletions += i2 - i1
+                    removed = f"[-{' '.join(words1[i1:i2])}-]"
+                if tag != 'delete':
                     # Words only in second passage
-                    inserted_words = words2[j1:j2]
-                    additions += len(inserted_words)
-                    changes.append(f"[+{' '.join(inserted_words)}+]")
-                elif tag == 'replace':
+                    additions += j2 - j1
+                    added = f"[+{' '.join(words2[j1:j2])}+]"
+
+                if tag == 'delete':
+                    changes.append(removed)
+                    result_parts.append(f"**{removed}**")
+                elif tag == 'insert':
+                    changes.append(added)
+                    result_parts.append(f"**{added}**")
+                else:
                     # Words that changed
-                    deleted_words = words1[i1:i2]
-                    inserted_words = words2[j1:j2]
-                    deletions += len(deleted_words)
-                    additions += len(inserted_words)
-                    changes.append(f"[-{' '.join(deleted_words)}-] → [+{' '.join(inserted_words)}+]")
+                    changes.append(f"{removed} → {added}")
+                    result_parts.append(f"**{removed}** → **{added}**")
 
             # If no differences, say so
             if not changes:
@@ -470,36 +625,19 @@ class ScripturianServer:
                     text=f"**No differences found**\n\n{pretty_ref1} and {pretty_ref2} have identical text."
                 )]
 
-            # Format the output with inline highlighting
-            output = f"**Comparing: {pretty_ref1} vs {pretty_ref2}**\n\n"
-
-            # Show detailed word-by-word diff
-            output += "**Changes:**\n\n"
-            for change in changes:
-                output += f"• {change}\n"
-
-            output += f"\n**Summary:** {additions} word(s) added, {deletions} word(s) removed\n\n"
-
-            # Show full text with inline markup
-            output += "**Full text comparison:**\n\n"
-            result_parts = []
-            for tag, i1, i2, j1, j2 in matcher.get_opcodes():
-                if tag == 'equal':
-                    result_parts.append(' '.join(words1[i1:i2]))
-                elif tag == 'delete':
-                    result_parts.append(f"**[-{' '.join(words1[i1:i2])}-]**")
-                elif tag == 'insert':
-                    result_parts.append(f"**[+{' '.join(words2[j1:j2])}+]**")
-                elif tag == 'replace':
-                    result_parts.append(f"**[-{' '.join(words1[i1:i2])}-]** → **[+{' '.join(words2[j1:j2])}+]**")
-
-            output += ' '.join(result_parts) + "\n\n"
-
-            # Add legend
-            output += "**Legend:**\n"
-            output += "- `[-text-]` = removed from first passage\n"
-            output += "- `[+text+]` = added in second passage\n"
-            output += "- `[-old-] → [+new+]` = replacement\n"
+            # Format the output with inline highlighting, then a detailed
+            # word-by-word diff, and the full text with inline markup
+            parts = [
+                f"**Comparing: {pretty_ref1} vs {pretty_ref2}**\n\n",
+                "**Changes:**\n\n"
+            ]
+            parts.extend(f"• {change}\n" for change in changes)
+            parts.append(f"\n**Summary:** {additions} word(s) added, {deletions} word(s) removed\n\n")
+            parts.append("**Full text comparison:**\n\n")
+            parts.append(' '.join(result_parts))
+            parts.append("\n\n")
+            parts.append(_COMPARE_LEGEND)
+            output = "".join(parts)
 
             return [TextContent(type="text", text=output)]
 
@@ -556,7 +694,10 @@ def main():
 
     vector_db_path.mkdir(parents=True, exist_ok=True)
 
-    server = ScripturianServer(data_path, vector_db_path)
+    # Query embeddings should come from the backend the index was built with
+    embedding_backend = os.environ.get("SCRIPTORIAN_EMBEDDING_BACKEND", "sentence-transformers")
+
+    server = ScripturianServer(data_path, vector_db_path, embedding_backend)
     server.run()
 
 
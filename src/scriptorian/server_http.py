@@ -36,8 +36,15 @@ def create_app():
 
     vector_db_path.mkdir(parents=True, exist_ok=True)
 
+    embedding_backend = os.environ.get("SCRIPTORIAN_EMBEDDING_BACKEND", "sentence-transformers")
+
     # Create scripture server
-    scripture_server = ScripturianServer(data_path, vector_db_path)
+    scripture_server = ScripturianServer(data_path, vector_db_path, embedding_backend)
+
+    # Each uvicorn worker runs create_app(); mapping the verse arrays, corpus
+    # and texts from shared files lets the workers share one copy in the OS
+    # page cache. From the verse cache this takes well under a second.
+    scripture_server.loader.load_all_verses().share(vector_db_path / "shared")
 
     # Generate a session ID for this server instance
     # In production, you might want to use a more sophisticated session management system
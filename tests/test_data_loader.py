@@ -0,0 +1,178 @@
+"""Tests for scripture data loader."""
+
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+from scriptorian.data_loader import CORPUS_SEPARATOR, ScriptureLoader
+
+
+DATA_PATH = Path(__file__).parent.parent / "data"
+
+
+@pytest.fixture(scope="module")
+def loader():
+    """Loader with volume metadata loaded."""
+    loader = ScriptureLoader(DATA_PATH)
+    loader.load_volumes()
+    return loader
+
+
+def test_load_scripture_verses(loader):
+    """Test loading a single chapter."""
+    verses = loader.load_scripture_verses(205, 3)
+
+    assert len(verses) > 0
+    assert verses[6].verse == 7
+    assert verses[6].short_reference == "1 Ne. 3:7"
+    assert verses[6].volume == "Book of Mormon"
+    assert "I will go and do" in verses[6].text
+
+
+def test_load_missing_chapter(loader):
+    """Test loading a chapter that does not exist."""
+    assert loader.load_scripture_verses(205, 999) == []
+
+
+def test_load_all_verses(loader):
+    """Test loading the full corpus."""
+    verses = loader.load_all_verses()
+
+    assert len(verses) > 40000
+    assert loader.load_all_verses() is verses
+
+    nephi = [v for v in verses if v.book_id == "205" and v.chapter == 3]
+    assert nephi == loader.load_scripture_verses(205, 3)
+    assert verses[-1] == list(verses)[-1]
+    assert verses[:2] == [verses[0], verses[1]]
+
+    # Chapters are ordered numerically, not lexicographically
+    genesis = [c for b, c in zip(verses.book_id, verses.chapter) if b == 101]
+    assert genesis == sorted(genesis)
+
+    i = verses.ids.index("205_3_7")
+    assert verses.metadatas[i]["short_reference"] == verses[i].short_reference
+    assert verses.metadatas[i]["reference"] == verses[i].reference
+
+
+@pytest.fixture
+def sample_data(tmp_path):
+    """Copy of the volume metadata and a few chapters, so tests never touch data/."""
+    data_path = tmp_path / "data"
+    (data_path / "scripture").mkdir(parents=True)
+    shutil.copy(DATA_PATH / "volumes.json", data_path / "volumes.json")
+    for name in ("205.3.json", "205.4.json", "205.22.json"):
+        shutil.copy(DATA_PATH / "scripture" / name, data_path / "scripture" / name)
+    return data_path
+
+
+def test_verse_cache(sample_data):
+    """Test that parsed verses are cached and reused."""
+    first = ScriptureLoader(sample_data)
+    first.load_volumes()
+    verses = first.load_all_verses()
+    assert first.cache_path.exists()
+
+    second = ScriptureLoader(sample_data)
+    second.load_volumes()
+    second._parse_args = None  # Any parse would now fail
+    assert list(second.load_all_verses()) == list(verses)
+
+
+def test_verse_cache_invalidation(sample_data):
+    """Test that editing a chapter in place invalidates the cache."""
+    first = ScriptureLoader(sample_data)
+    first.load_volumes()
+    verses = first.load_all_verses()
+
+    # Rewrite a chapter but keep its old mtime, which the directory's and
+    # the cache's mtimes cannot reveal
+    chapter = sample_data / "scripture" / "205.4.json"
+    stat = chapter.stat()
+    shutil.copy(sample_data / "scripture" / "205.3.json", chapter)
+    os.utime(chapter, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    second = ScriptureLoader(sample_data)
+    second.load_volumes()
+    reloaded = second.load_all_verses()
+    assert reloaded.chapter_verses(205, 4) != verses.chapter_verses(205, 4)
+    assert [v.text for v in reloaded.chapter_verses(205, 4)] == [
+        v.text for v in verses.chapter_verses(205, 3)
+    ]
+
+
+def test_load_scripture_verses_from_columns(loader):
+    """Test chapter lookups agree whether served from the columns or the files."""
+    verses = loader.load_all_verses()
+    files = ScriptureLoader(loader.data_path)
+    files.load_volumes()
+
+    for book_id, chapter in [(101, 1), (205, 3), (205, 22), (201, 0), (205, 999)]:
+        expected = files.load_scripture_verses(book_id, chapter)
+        assert loader.load_scripture_verses(book_id, chapter) == expected
+        assert verses.chapter_verses(book_id, chapter) == expected
+
+
+def test_verse_corpus(loader):
+    """Test the joined corpus lines up with each verse's text."""
+    verses = loader.load_all_verses()
+    corpus = verses.corpus
+
+    assert corpus.count(CORPUS_SEPARATOR) == len(verses) - 1
+    assert verses.lower_corpus == corpus.lower()
+    for i in (0, 1, len(verses) // 2, len(verses) - 1):
+        data = verses.text[i].encode('utf-8')
+        start = verses.offsets[i]
+        assert corpus[start:start + len(data)] == data
+        assert verses.ascii_mask[i] == (len(data) == len(verses.text[i]))
+
+
+def test_share_verse_columns(sample_data, tmp_path):
+    """Test that shared columns are memory-mapped and read the same."""
+    shared = tmp_path / "shared"
+    loader = ScriptureLoader(sample_data)
+    loader.load_volumes()
+    verses = loader.load_all_verses()
+    corpus, lower_corpus, texts = verses.corpus, verses.lower_corpus, verses.text
+    expected = loader.load_scripture_verses(205, 3)
+
+    verses.share(shared)
+
+    assert isinstance(verses.book_id.base, np.memmap)
+    assert isinstance(verses.offsets.base, np.memmap)
+    assert verses.corpus[:] == corpus
+    assert verses.lower_corpus[:] == lower_corpus
+    # Texts are decoded from the shared corpus
+    assert not isinstance(verses.text, list)
+    assert list(verses.text) == texts
+    assert [verses.text[i] for i in range(len(texts))] == texts
+    assert verses.text[-1] == texts[-1]
+    assert verses.text[3:7] == texts[3:7]
+    assert loader.load_scripture_verses(205, 3) == expected
+
+    # A second process reuses the files
+    other = ScriptureLoader(sample_data)
+    other.load_volumes()
+    other.load_all_verses().share(shared)
+    assert other.verses.corpus[:] == corpus
+
+
+def test_get_book_by_abbr(loader):
+    """Test case-insensitive book lookup by abbreviation."""
+    book = loader.get_book_by_abbr("1_NE")
+
+    assert book is not None
+    assert book.id == 205
+    assert loader.get_book_by_abbr("1 Ne.") is book
+    assert loader.get_book_by_abbr("nope") is None
+
+
+def test_get_book_by_name(loader):
+    """Test book lookup by full or partial name."""
+    assert loader.get_book_by_name("Alma").full_name == "Alma"
+    assert loader.get_book_by_name("john").full_name == "John"
+    assert loader.get_book_by_name("Mormon").full_name == "Mormon"
+    assert loader.get_book_by_name("Corinth").full_name == "1 Corinthians"
+    assert loader.get_book_by_name("nonexistent") is None
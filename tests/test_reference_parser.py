@@ -90,3 +90,21 @@ def test_dc_reference():
     assert result.references[0].chapters[0].start == 121
     assert result.references[0].chapters[0].verses[0].start == 1
     assert result.references[0].chapters[0].verses[0].end == 6
+
+
+def test_parse_is_cached():
+    """Test that repeated references reuse the parsed result."""
+    first = ReferenceParser.parse("John 3:16")
+    second = ReferenceParser.parse("  John 3:16 ")
+
+    assert first is second
+    assert first.valid
+
+
+def test_parse_range():
+    """Test numeric range parsing."""
+    assert ReferenceParser._parse_range("3") == (3, 3)
+    assert ReferenceParser._parse_range(" 1 - 5 ") == (1, 5)
+    assert ReferenceParser._parse_range("1-5-7") is None
+    assert ReferenceParser._parse_range("a") is None
+    assert ReferenceParser._parse_range("") is None
@@ -0,0 +1,507 @@
+"""Tests for scripture search."""
+
+import json
+import re
+import uuid
+import zlib
+from pathlib import Path
+from types import SimpleNamespace
+
+import chromadb
+import numpy as np
+import pytest
+from scriptorian._context import extract_context
+from scriptorian.data_loader import ScriptureLoader, VerseColumns
+from scriptorian.search import (
+    ExactSearch,
+    SemanticSearch,
+    dumps_search_results,
+    format_search_results,
+)
+
+
+DATA_PATH = Path(__file__).parent.parent / "data"
+
+
+@pytest.fixture(scope="module")
+def exact_search():
+    """Exact search over the full corpus."""
+    loader = ScriptureLoader(DATA_PATH)
+    loader.load_volumes()
+    return ExactSearch(loader)
+
+
+class StubEmbedder:
+    """Bag-of-words hashing embedder standing in for a sentence-transformer."""
+
+    DIM = 64
+
+    def encode(self, texts, batch_size=32, show_progress_bar=False, **kwargs):
+        rows = np.zeros((len(texts), self.DIM), dtype=np.float32)
+        for row, text in zip(rows, texts):
+            for word in re.findall(r"\w+", text.lower()):
+                row[zlib.crc32(word.encode()) % self.DIM] += 1.0
+        rows /= np.maximum(np.linalg.norm(rows, axis=1, keepdims=True), 1e-12)
+        return rows
+
+    def __iter__(self):
+        # No Transformer or Pooling modules, so encode_bucketed() uses encode()
+        return iter(())
+
+
+@pytest.fixture(scope="module")
+def sample_loader():
+    """Loader holding only the first 300 verses, so indexing stays quick."""
+    loader = ScriptureLoader(DATA_PATH)
+    loader.load_volumes()
+    loader.verses = VerseColumns.from_verses(loader.load_all_verses()[:300])
+    return loader
+
+
+def make_semantic_search(loader, **kwargs):
+    """SemanticSearch over an empty in-memory collection, with the stub embedder."""
+    search = SemanticSearch(loader, **kwargs)
+    # Ephemeral clients share state within a process, so give each
+    # instance its own collection
+    search.COLLECTION_NAME = f"scriptures_{uuid.uuid4().hex}"
+    search.embedder = StubEmbedder()
+    search.client = chromadb.EphemeralClient()
+    search.collection = search.client.create_collection(
+        name=search.COLLECTION_NAME,
+        metadata=search.COLLECTION_METADATA
+    )
+    search._initialized = True
+    return search
+
+
+@pytest.fixture
+def semantic_search(sample_loader):
+    """Indexed semantic search over the sample verses."""
+    search = make_semantic_search(sample_loader)
+    search.index_scriptures()
+    return search
+
+
+def test_exact_search(exact_search):
+    """Test a case-insensitive phrase search."""
+    results = exact_search.search("i will go and do")
+
+    references = [r.short_reference for r in results]
+    assert "1 Ne. 3:7" in references
+
+    result = results[references.index("1 Ne. 3:7")]
+    assert "**I will go and do**" in result.context
+    assert result.book_name == "First Nephi"
+    assert result.chapter == 3
+    assert result.verse == 7
+
+
+def test_exact_search_matches_verse_scan(exact_search):
+    """Test that each matching verse is reported once, in corpus order."""
+    verses = exact_search.loader.load_all_verses()
+
+    cases = [
+        ("faith", False),
+        ("Lord", True),
+        ("the", False),
+        ("aith in chr", False),
+        ("Zarahemla", True),
+        ("it came to pass", False),
+        ("the lord’s", False),
+        ("z", False),
+        ("o ye", False),
+    ]
+    for query, case_sensitive in cases:
+        needle = query if case_sensitive else query.lower()
+        expected = [
+            verses[i].reference
+            for i, text in enumerate(verses.text)
+            if needle in (text if case_sensitive else text.lower())
+        ]
+        results = exact_search.search(query, case_sensitive=case_sensitive)
+        assert [r.reference for r in results] == expected
+        assert all(
+            r.context.count("**") == 2
+            and needle in (r.context if case_sensitive else r.context.lower())
+            for r in results
+        )
+
+
+def test_short_query_skips_word_index(monkeypatch):
+    """Test that queries of single letters full-scan without building the word index."""
+    loader = ScriptureLoader(DATA_PATH)
+    loader.load_volumes()
+    search = ExactSearch(loader)
+
+    def no_postings():
+        raise AssertionError("word index built for a short query")
+
+    monkeypatch.setattr(search, "_get_postings", no_postings)
+    results = search.search("z")
+    assert results
+    assert all("z" in r.verse_text.lower() for r in results)
+    assert search._candidates("a b c") is None
+
+
+def test_exact_search_highlights_verse_text(exact_search):
+    """Test that highlights use the verse's casing and treat the query literally."""
+    results = exact_search.search("I WILL GO AND DO")
+    assert "**I will go and do**" in results[0].context
+
+    # Regex metacharacters in the query are matched literally
+    results = exact_search.search("amen.")
+    assert results
+    assert all("**Amen.**" in r.context or "**amen.**" in r.context for r in results)
+    assert exact_search.search("a.e.") == []
+
+
+def test_exact_search_empty(exact_search):
+    """Test empty and unmatched queries."""
+    assert exact_search.search("") == []
+    assert exact_search.search("   ") == []
+    assert exact_search.search("xyzzy plugh") == []
+
+
+def test_extract_context():
+    """Test context windows and highlighting around a known match offset."""
+    text = "a b c d e f g"
+
+    assert extract_context(text, 6, 1, 2) == "... b c **d** e f ..."
+    assert extract_context(text, 0, 3, 1) == "**a b** c ..."
+    assert extract_context(text, 12, 1, 5) == "... b c d e f **g**"
+    assert extract_context("abc", 1, 1, 5) == "a**b**c"
+
+    # Double spaces between sentences do not count as extra words, and
+    # the context joins words with single spaces as str.split() would
+    text = "One.  Two three.  Four five"
+    assert extract_context(text, 10, 6, 1) == "... Two **three.** Four ..."
+    assert extract_context(text, 0, 4, 2) == "**One.** Two three. ..."
+
+    # Line breaks and tabs separate words just as spaces do, alone or in runs
+    text = "one\ntwo three\tfour five"
+    assert extract_context(text, 8, 5, 1) == "... two **three** four ..."
+    assert extract_context(text, 0, 3, 1) == "**one** two ..."
+    text = "one. \ntwo\t\tthree \n\n four"
+    assert extract_context(text, 11, 5, 1) == "... two **three** four"
+    assert extract_context(text, 0, 4, 2) == "**one.** two three ..."
+
+
+def test_exact_search_context_line_breaks(exact_search):
+    """Test context in a verse whose lines are separated by newlines (D&C 84:99)."""
+    results = exact_search.search("brought to pass by the faith", context_words=1)
+
+    assert [(r.chapter, r.verse) for r in results] == [(84, 99)]
+    assert results[0].context == "... was **brought to pass by the faith**<br /> ..."
+
+    results = exact_search.search("brought to pass by the faith", context_words=3)
+    assert results[0].context == (
+        "... /> Which was **brought to pass by the faith**<br /> And covenant ..."
+    )
+
+
+def test_format_search_results(exact_search):
+    """Test the camelCase result dictionaries and their JSON form."""
+    results = exact_search.search("i will go and do")[:1]
+    formatted = format_search_results(results)
+
+    assert formatted[0]["shortReference"] == "1 Ne. 3:7"
+    assert formatted[0]["bookName"] == "First Nephi"
+    assert formatted[0]["score"] is None
+    assert json.loads(dumps_search_results(results)) == formatted
+
+
+@pytest.mark.parametrize("single_pass", [True, False])
+def test_multi_search(exact_search, monkeypatch, single_pass):
+    """Test that multi_search agrees with searching each term separately."""
+    if single_pass:
+        pytest.importorskip("ahocorasick_rs")
+    else:
+        monkeypatch.setattr("scriptorian.search.ahocorasick_rs", None)
+
+    terms = ["faith", "faithful", "Charity", "", "the lord’s", "faith"]
+    results = exact_search.multi_search(terms)
+
+    assert list(results) == ["faith", "faithful", "Charity", "the lord’s"]
+    for term, term_results in results.items():
+        assert term_results == exact_search.search(term)
+
+    results = exact_search.multi_search(["Lord", "lord"], case_sensitive=True)
+    assert results["lord"] == exact_search.search("lord", case_sensitive=True)
+
+
+def test_semantic_search(semantic_search, sample_loader):
+    """Test that a verse's own text finds that verse first."""
+    verse = sample_loader.verses[42]
+    results = semantic_search.search(verse.text, n_results=5)
+
+    assert len(results) == 5
+    assert results[0].reference == verse.reference
+    assert results[0].score == pytest.approx(1.0, abs=1e-5)
+
+
+def test_semantic_result_cache(semantic_search, sample_loader, monkeypatch):
+    """Test that near-duplicate queries reuse cached results."""
+    queries = []
+    query = semantic_search._query
+
+    def counting_query(embeddings, n_results):
+        queries.append(n_results)
+        return query(embeddings, n_results)
+
+    monkeypatch.setattr(semantic_search, "_query", counting_query)
+
+    text = sample_loader.verses[7].text
+    first = semantic_search.search(text, n_results=5)
+    # Same words, so the same embedding: answered from the cache
+    assert semantic_search.search(text.upper(), n_results=5) == first
+    # Fewer results are a prefix of the cached ones
+    assert semantic_search.search(text, n_results=3) == first[:3]
+    assert queries == [5]
+
+    # More results than were cached needs a fresh query
+    assert len(semantic_search.search(text, n_results=8)) == 8
+    assert queries == [5, 8]
+
+    # A different query misses
+    semantic_search.search("faith hope charity", n_results=5)
+    assert queries == [5, 8, 5]
+
+    # Returned lists are copies, so callers cannot corrupt the cache
+    semantic_search.search(text, n_results=5).clear()
+    assert semantic_search.search(text, n_results=5) == first
+    assert queries == [5, 8, 5]
+
+    # Reindexing forgets cached results
+    semantic_search.index_scriptures(force_reindex=True)
+    semantic_search.search(text, n_results=5)
+    assert queries == [5, 8, 5, 5]
+
+
+def test_semantic_result_cache_evicts_oldest(sample_loader, monkeypatch):
+    """Test that a full cache evicts its oldest entry first."""
+    monkeypatch.setattr(SemanticSearch, "RESULT_CACHE_SIZE", 2)
+    search = make_semantic_search(sample_loader)
+    search.index_scriptures()
+
+    for query in ["faith", "hope", "charity"]:
+        search.search(query, n_results=3)
+
+    assert search._cached_results(search._encode_query("faith"), 3) is None
+    assert search._cached_results(search._encode_query("charity"), 3) is not None
+
+
+def test_semantic_search_faiss(semantic_search, sample_loader):
+    """Test that the in-memory FAISS index ranks like the collection."""
+    pytest.importorskip("faiss")
+    faiss_search = make_semantic_search(sample_loader, use_faiss=True)
+    faiss_search.index_scriptures()
+
+    for query in ["faith hope charity", sample_loader.verses[3].text]:
+        expected = semantic_search.search(query, n_results=5)
+        results = faiss_search.search(query, n_results=5)
+
+        assert [r.reference for r in results] == [r.reference for r in expected]
+        assert [r.score for r in results] == pytest.approx(
+            [r.score for r in expected], abs=1e-5
+        )
+
+    # Asking for more results than there are verses returns them all
+    assert len(faiss_search.search("faith", n_results=500)) == len(sample_loader.verses)
+
+
+def test_semantic_search_faiss_quantized(semantic_search, sample_loader):
+    """Test that the int8 FAISS index gives nearly the exact scores."""
+    faiss = pytest.importorskip("faiss")
+    quantized = make_semantic_search(sample_loader, use_faiss=True, quantize=True)
+    quantized.index_scriptures()
+
+    verse = sample_loader.verses[11]
+    results = quantized.search(verse.text, n_results=5)
+    expected = semantic_search.search(verse.text, n_results=5)
+
+    assert isinstance(quantized._faiss[0], faiss.IndexScalarQuantizer)
+    assert results[0].reference == verse.reference
+    assert [r.score for r in results] == pytest.approx(
+        [r.score for r in expected], abs=0.02
+    )
+
+    with pytest.raises(ValueError):
+        SemanticSearch(sample_loader, quantize=True)
+
+
+def test_semantic_search_batch(semantic_search, sample_loader):
+    """Test that batched queries match single searches, in query order."""
+    queries = ["faith hope charity", "", sample_loader.verses[20].text, "   "]
+    results = semantic_search.search_batch(queries, n_results=4)
+
+    assert len(results) == len(queries)
+    assert results[1] == [] and results[3] == []
+    for query, query_results in zip(queries[::2], results[::2]):
+        expected = semantic_search.search(query, n_results=4)
+        assert [r.reference for r in query_results] == [r.reference for r in expected]
+        assert [r.score for r in query_results] == pytest.approx(
+            [r.score for r in expected], abs=1e-5
+        )
+
+    assert semantic_search.search_batch(["", " "]) == [[], []]
+    assert semantic_search.search_batch([]) == []
+
+
+def test_index_scriptures_resume(sample_loader, semantic_search, monkeypatch):
+    """Test that resuming a partial index only embeds the missing verses."""
+    search = make_semantic_search(sample_loader)
+    stored = semantic_search.collection.get(
+        ids=sample_loader.verses.ids[:120], include=["embeddings", "documents", "metadatas"]
+    )
+    search.collection.add(**{key: stored[key] for key in ("ids", "embeddings", "documents", "metadatas")})
+
+    # Without resume a non-empty collection is left alone
+    search.index_scriptures()
+    assert search.collection.count() == 120
+
+    encoded = []
+    encode = search.embedder.encode
+    monkeypatch.setattr(search.embedder, "encode", lambda texts, **kwargs: (
+        encoded.extend(texts) or encode(texts, **kwargs)
+    ))
+    search.index_scriptures(resume=True)
+
+    assert len(encoded) == len(sample_loader.verses) - 120
+    assert search.collection.count() == len(sample_loader.verses)
+    assert search.is_indexed()
+    query = sample_loader.verses[200].text
+    assert search.search(query, n_results=3)[0].reference == sample_loader.verses[200].reference
+
+
+def test_is_indexed(sample_loader, monkeypatch):
+    """Test that is_indexed stops querying Chroma once the index is known."""
+    search = make_semantic_search(sample_loader)
+    assert not search.is_indexed()
+
+    search.index_scriptures()
+
+    def no_count():
+        raise AssertionError("count() called on a known index")
+
+    monkeypatch.setattr(search.collection, "count", no_count)
+    assert search.is_indexed()
+    monkeypatch.undo()
+
+    search.reset_collection()
+    assert not search.is_indexed()
+
+
+class StubBatch(dict):
+    """Padded tokenizer output, standing in for a transformers BatchEncoding."""
+
+    def to(self, device):
+        return StubBatch({key: value.to(device) for key, value in self.items()})
+
+
+class StubTokenizer:
+    """Whitespace tokenizer hashing words into a small vocabulary."""
+
+    VOCAB = 512
+
+    def __call__(self, texts, truncation=True, max_length=None):
+        input_ids = [
+            [zlib.crc32(word.encode()) % (self.VOCAB - 1) + 1 for word in text.lower().split()]
+            [:max_length]
+            for text in texts
+        ]
+        return {
+            "input_ids": input_ids,
+            "attention_mask": [[1] * len(ids) for ids in input_ids],
+        }
+
+    def pad(self, encoded, return_tensors="pt"):
+        import torch
+
+        width = max(len(ids) for ids in encoded["input_ids"])
+        return StubBatch({
+            key: torch.tensor([row + [0] * (width - len(row)) for row in rows])
+            for key, rows in encoded.items()
+        })
+
+
+class Transformer(SimpleNamespace):
+    """Stands in for sentence_transformers' Transformer module."""
+
+
+class Pooling(SimpleNamespace):
+    """Stands in for sentence_transformers' Pooling module (pooling_mode as of 6.0)."""
+
+
+class Normalize(SimpleNamespace):
+    """Stands in for sentence_transformers' Normalize module."""
+
+
+class Dense(SimpleNamespace):
+    """Stands in for sentence_transformers' Dense module."""
+
+
+class StubSentenceTransformer(list):
+    """Transformer and mean-pooling modules shaped like a SentenceTransformer."""
+
+    DIM = 16
+
+    def __init__(self, *extra_modules, pooling_mode="mean"):
+        import torch
+
+        torch.manual_seed(0)
+        embedding = torch.nn.Embedding(StubTokenizer.VOCAB, self.DIM)
+        transformer = Transformer(
+            tokenizer=StubTokenizer(),
+            auto_model=lambda input_ids, attention_mask: SimpleNamespace(
+                last_hidden_state=embedding(input_ids)
+            ),
+            max_seq_length=128,
+        )
+        super().__init__([transformer, Pooling(pooling_mode=pooling_mode), *extra_modules])
+        self.device = "cpu"
+
+    def get_sentence_embedding_dimension(self):
+        return self.DIM
+
+
+def test_encode_bucketed(sample_loader):
+    """Test that bucketed embeddings come back in input order, unaffected by padding."""
+    pytest.importorskip("torch")
+
+    search = make_semantic_search(sample_loader)
+    search.embedder = StubSentenceTransformer()
+    texts = [verse.text for verse in sample_loader.verses[:60]]
+    lengths = [len(text.split()) for text in texts]
+    assert min(lengths) <= SemanticSearch.BUCKET_BOUNDS[0] < max(lengths)
+
+    embeddings = search.encode_bucketed(texts, batch_size=7)
+
+    assert embeddings.shape == (len(texts), StubSentenceTransformer.DIM)
+    assert embeddings.dtype == np.float32
+    expected = np.vstack([search.encode_bucketed([text]) for text in texts])
+    np.testing.assert_allclose(embeddings, expected, atol=1e-5)
+    np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, atol=1e-5)
+
+
+@pytest.mark.parametrize("modules, bucketed", [
+    ((), True),
+    ((Normalize(),), True),
+    ((Dense(),), False),
+    ((Dense(), Normalize()), False),
+    ((Normalize(), Normalize()), False),
+])
+def test_encode_bucketed_fallback(sample_loader, monkeypatch, modules, bucketed):
+    """Test that encode_bucketed only reimplements Transformer -> mean Pooling (-> Normalize)."""
+    pytest.importorskip("torch")
+
+    search = make_semantic_search(sample_loader)
+    search.embedder = StubSentenceTransformer(*modules)
+    encoded = []
+    monkeypatch.setattr(search, "encode", lambda texts, **kwargs: encoded.append(texts))
+
+    search.encode_bucketed(["And it came to pass"])
+    assert encoded == ([] if bucketed else [["And it came to pass"]])
+
+    search.embedder = StubSentenceTransformer(*modules, pooling_mode="cls")
+    search.encode_bucketed(["And it came to pass"])
+    assert encoded[-1] == ["And it came to pass"]
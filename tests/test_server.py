@@ -0,0 +1,190 @@
+"""Tests for the MCP server tools."""
+
+from pathlib import Path
+
+import pytest
+from mcp.types import ListToolsRequest
+from scriptorian.server import OUTPUT_CHUNK_SIZE, ScripturianServer, _word_opcodes
+
+
+DATA_PATH = Path(__file__).parent.parent / "data"
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    """Server over the bundled data; semantic search is never initialized."""
+    return ScripturianServer(DATA_PATH, tmp_path_factory.mktemp("vector_db"))
+
+
+async def test_fetch_scripture(server):
+    """Test fetching a verse range."""
+    result = await server._fetch_scripture({"reference": "1 Ne 3:7-8"})
+    text = result[0].text
+
+    assert text.startswith("**")
+    assert "1 Ne. 3:7 And it came to pass" in text
+    assert "1 Ne. 3:8 " in text
+    assert "1 Ne. 3:9 " not in text
+
+
+async def test_fetch_scripture_chunked(server):
+    """Test that a long passage is split into blocks at verse boundaries."""
+    result = await server._fetch_scripture({"reference": "Alma 32"})
+
+    assert len(result) > 1
+    assert all(len(block.text) <= OUTPUT_CHUNK_SIZE for block in result)
+    assert all(block.text.endswith("\n\n") for block in result)
+
+    verses, _ = server._resolve("Alma 32")
+    text = "".join(block.text for block in result)
+    assert text.count("Alma 32:") == len(verses)
+
+
+async def test_fetch_scripture_invalid(server):
+    """Test an unparseable reference."""
+    result = await server._fetch_scripture({"reference": ""})
+    assert result[0].text.startswith("Invalid reference:")
+
+
+async def test_exact_search_tool(server):
+    """Test exact search output and result limit."""
+    result = await server._exact_search({"query": "faith", "max_results": 3})
+
+    assert result[0].text.startswith("**Found 3 matches for 'faith'**")
+    assert result[1].text.startswith("\n\nJSON Results:\n[")
+
+
+async def test_compare_scripture(server):
+    """Test comparing two passages."""
+    result = await server._compare_scripture({
+        "reference1": "1 Ne 3:7",
+        "reference2": "1 Ne 3:8"
+    })
+    text = result[0].text
+
+    assert text.startswith("**Comparing: ")
+    assert "**Changes:**" in text
+    assert "**Summary:**" in text
+    assert "**Legend:**" in text
+
+    result = await server._compare_scripture({
+        "reference1": "Alma 32:21",
+        "reference2": "Alma 32:21"
+    })
+    assert result[0].text.startswith("**No differences found**")
+
+
+async def test_compare_sacrament_prayers(server):
+    """Test the documented Moroni 4:3 / D&C 20:77 comparison word for word."""
+    result = await server._compare_scripture({
+        "reference1": "Moroni 4:3",
+        "reference2": "D&C 20:77"
+    })
+    text = result[0].text
+
+    changes = text.split("**Changes:**\n\n")[1].split("\n\n")[0]
+    assert changes.splitlines() == [
+        "• [-it;-] → [+it,+]",
+        "• [-him,-] → [+him+]",
+        "• [-hath-] → [+has+]",
+        "• [-them,-] → [+them;+]",
+    ]
+    assert "**Summary:** 4 word(s) added, 4 word(s) removed" in text
+    assert "which he **[-hath-]** → **[+has+]** given **[-them,-]**" in text
+
+
+async def test_batch_execute(server):
+    """Test that batched calls return each tool's output in order."""
+    result = await server._batch_execute({"calls": [
+        {"name": "fetch_scripture", "arguments": {"reference": "1 Ne 3:7"}},
+        {"name": "parse_reference", "arguments": {"reference": "Alma 32:21"}},
+        {"name": "batch_execute", "arguments": {"calls": []}},
+    ]})
+    texts = [block.text for block in result]
+
+    assert texts[0] == "### 1. fetch_scripture\n\n"
+    assert "1 Ne. 3:7 " in texts[1]
+    assert texts[2] == "### 2. parse_reference\n\n"
+    assert '"valid": true' in texts[3]
+    assert texts[4:] == ["### 3. batch_execute\n\n", "Unknown tool: batch_execute"]
+
+
+@pytest.mark.parametrize("arguments", [
+    None,
+    "calls",
+    {},
+    {"calls": "fetch_scripture"},
+    {"calls": {"name": "fetch_scripture"}},
+    {"calls": ["fetch_scripture"]},
+    {"calls": [{"name": "fetch_scripture"}, None]},
+    {"calls": [{"name": ["fetch_scripture"]}]},
+])
+async def test_batch_execute_malformed(server, arguments):
+    """Test that malformed batches are reported as text instead of raising."""
+    result = await server._batch_execute(arguments)
+
+    assert len(result) == 1
+    assert result[0].text.startswith("Error executing batch_execute: 'calls' must be a list")
+
+
+async def test_batch_execute_bad_arguments(server):
+    """Test that a call with malformed arguments fails alone."""
+    result = await server._batch_execute({"calls": [
+        {"name": "fetch_scripture", "arguments": "1 Ne 3:7"},
+        {"name": "fetch_scripture", "arguments": {"reference": "1 Ne 3:7"}},
+    ]})
+    texts = [block.text for block in result]
+
+    assert texts[1].startswith("Error executing fetch_scripture: ")
+    assert "1 Ne. 3:7 " in texts[3]
+
+
+async def test_list_tools_is_cached(server):
+    """Test that tools/list returns the tool definitions built at startup."""
+    handler = server.app.request_handlers[ListToolsRequest]
+    first = await handler(ListToolsRequest(method="tools/list"))
+    second = await handler(ListToolsRequest(method="tools/list"))
+
+    assert [tool.name for tool in first.root.tools][0] == "fetch_scripture"
+    assert first.root.tools == second.root.tools == server._tools
+
+
+def test_resolve_is_cached(server):
+    """Test that resolved references are memoized as immutable tuples."""
+    verses, pretty = server._resolve("Alma 32:21")
+
+    assert isinstance(verses, tuple)
+    assert verses[0].short_reference == "Alma 32:21"
+    assert server._resolve("Alma 32:21")[0] is verses
+
+    with pytest.raises(ValueError):
+        server._resolve("")
+
+
+def test_resolve_verse_ranges(server):
+    """Test verse ranges in chapters numbered from 1 and from 0."""
+    def verse_numbers(reference):
+        return [v.verse for v in server._resolve(reference)[0]]
+
+    assert verse_numbers("1 Ne 3:7-8") == [7, 8]
+    assert verse_numbers("1 Ne 3:30-99") == [30, 31]
+    assert verse_numbers("D&C 4:0-2") == [0, 1, 2]
+    assert verse_numbers("D&C 4:2-3") == [2, 3]
+
+
+def test_word_opcodes():
+    """Test that word diff opcodes rebuild the second passage from the first."""
+    words1 = "and it came to pass that I Nephi said unto my father".split()
+    words2 = "and it came to pass that when my father had heard".split()
+    opcodes = _word_opcodes(words1, words2)
+
+    rebuilt = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            assert words1[i1:i2] == words2[j1:j2]
+            rebuilt.extend(words1[i1:i2])
+        else:
+            rebuilt.extend(words2[j1:j2])
+    assert rebuilt == words2
+    assert opcodes[0] == ("equal", 0, 6, 0, 6)
+    assert _word_opcodes(words1, words1) == [("equal", 0, len(words1), 0, len(words1))]